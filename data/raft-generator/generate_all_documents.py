@@ -16,10 +16,11 @@ All documents are designed to be realistic and comprehensive for training AI mod
 on hardware store knowledge and customer service scenarios.
 """
 
-import asyncio
+import argparse
 import logging
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import asyncpg
@@ -28,7 +29,18 @@ import asyncpg
 sys.path.append(str(Path(__file__).parent))
 
 from generate_knowledge_base import create_knowledge_base_documents
-from generate_product_documents import create_documents_table, generate_and_insert_documents
+from generate_product_documents import (
+    INDEX_BUILD_CONNECTIONS,
+    convert_document_type_column,
+    create_document_indexes,
+    create_document_type_enum,
+    create_documents_table,
+    drop_document_indexes,
+    generate_and_insert_documents,
+    register_jsonb_codec,
+    reseed_worker,
+    run,
+)
 from generate_safety_docs import generate_safety_documents
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -44,66 +56,159 @@ POSTGRES_CONFIG = {
 
 SCHEMA_NAME = 'retail'
 
+# Statistics queries are built once so the SQL text is identical on every call,
+# letting asyncpg's per-connection statement cache reuse the prepared plans
+SQL_DOC_TYPES = f"""
+    SELECT document_type, COUNT(*) as count, 
+           ROUND(AVG(LENGTH(content))) as avg_length,
+           MIN(LENGTH(content)) as min_length,
+           MAX(LENGTH(content)) as max_length
+    FROM {SCHEMA_NAME}.product_documents
+    GROUP BY document_type
+    ORDER BY count DESC
+"""
+
+SQL_CATEGORY_STATS = f"""
+    SELECT 
+        COALESCE(metadata->>'category', 'GENERAL') as category,
+        COUNT(*) as count
+    FROM {SCHEMA_NAME}.product_documents
+    GROUP BY metadata->>'category'
+    ORDER BY count DESC
+"""
+
+SQL_CONTENT_STATS = f"""
+    SELECT 
+        COUNT(*) as total_documents,
+        SUM(LENGTH(content)) as total_characters,
+        ROUND(AVG(LENGTH(content))) as avg_document_length,
+        COUNT(DISTINCT product_id) as products_with_docs,
+        COUNT(CASE WHEN product_id IS NULL THEN 1 END) as general_documents,
+        COUNT(*) FILTER (WHERE content IS NOT NULL AND LENGTH(content) > 100) as embedding_ready
+    FROM {SCHEMA_NAME}.product_documents
+"""
+
+# On-disk footprint from the catalog (heap + TOAST + indexes) rather than summing content
+SQL_STORAGE_SIZE = f"SELECT pg_total_relation_size('{SCHEMA_NAME}.product_documents')"
+
+# Below this many rows a full ORDER BY RANDOM() is cheap and TABLESAMPLE returns too few rows
+SAMPLE_TITLES_TABLESAMPLE_THRESHOLD = 100_000
+
+SQL_SAMPLE_TITLES = f"""
+    SELECT document_type,
+           CASE WHEN LENGTH(title) > 60 THEN LEFT(title, 57) || '...' ELSE title END AS title
+    FROM {SCHEMA_NAME}.product_documents
+    ORDER BY RANDOM()
+    LIMIT 10
+"""
+
+# Shuffle the sampled rows too so LIMIT does not just keep the first pages in heap order
+SQL_SAMPLE_TITLES_TABLESAMPLE = f"""
+    SELECT document_type,
+           CASE WHEN LENGTH(title) > 60 THEN LEFT(title, 57) || '...' ELSE title END AS title
+    FROM {SCHEMA_NAME}.product_documents TABLESAMPLE BERNOULLI (1)
+    ORDER BY RANDOM()
+    LIMIT 10
+"""
+
+async def estimated_row_count(conn: asyncpg.Connection, table_name: str) -> int:
+    """Planner row estimate from pg_class, falling back to COUNT(*) for tables never analyzed"""
+    estimate = await conn.fetchval("""
+        SELECT c.reltuples::bigint
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = $1 AND c.relname = $2
+    """, SCHEMA_NAME, table_name)
+    
+    # reltuples is -1 until the table has been vacuumed or analyzed
+    if estimate is None or estimate < 0:
+        return await conn.fetchval(f"SELECT COUNT(*) FROM {SCHEMA_NAME}.{table_name}")
+    return estimate
+
 async def main():
     """Generate all types of documents for RAG/RAFT training"""
+    parser = argparse.ArgumentParser(description='Generate unstructured documents for RAG/RAFT training')
+    parser.add_argument('--bulk-reindex', action='store_true',
+                       help='Drop product_documents secondary indexes during the load and rebuild them afterwards')
+    
+    args = parser.parse_args()
     
     try:
         # Connect to database
         conn = await asyncpg.connect(**POSTGRES_CONFIG)
+        await register_jsonb_codec(conn)
         logging.info("🔌 Connected to PostgreSQL database")
         
-        # Verify the main tables exist
-        tables_check = await conn.fetch("""
-            SELECT table_name 
+        # Verify the main tables exist and check for the documents table in one round trip
+        tables_check = await conn.fetchrow("""
+            SELECT COALESCE(bool_or(table_name = 'products'), false) AS has_products,
+                   COALESCE(bool_or(table_name = 'categories'), false) AS has_categories,
+                   COALESCE(bool_or(table_name = 'product_types'), false) AS has_product_types,
+                   COALESCE(bool_or(table_name = 'product_documents'), false) AS has_docs
             FROM information_schema.tables 
             WHERE table_schema = $1 
-            AND table_name IN ('products', 'categories', 'product_types')
-        """, SCHEMA_NAME)
+            AND table_name = ANY($2::text[])
+        """, SCHEMA_NAME, ['products', 'categories', 'product_types', 'product_documents'])
         
-        if len(tables_check) < 3:
+        if not (tables_check['has_products'] and tables_check['has_categories'] and tables_check['has_product_types']):
             logging.error("❌ Required tables not found. Please run generate_zava_postgres.py first.")
             return
         
-        # Check if documents table exists, create if not
-        docs_table_exists = await conn.fetchval("""
-            SELECT EXISTS (
-                SELECT FROM information_schema.tables 
-                WHERE table_schema = $1 AND table_name = 'product_documents'
-            )
-        """, SCHEMA_NAME)
+        # Secondary indexes are built after the load when the table is new or --bulk-reindex is given
+        defer_indexes = args.bulk_reindex or not tables_check['has_docs']
         
-        if not docs_table_exists:
+        # Create documents table if it does not exist
+        if not tables_check['has_docs']:
             logging.info("📄 Creating product_documents table...")
-            await create_documents_table(conn)
+            await create_documents_table(conn, with_indexes=False)
         else:
             logging.info("📄 Product documents table already exists")
+            # Tables from earlier runs may lack newer enum labels or still store document_type as TEXT
+            await create_document_type_enum(conn)
+            await convert_document_type_column(conn)
         
         # Get product count for progress tracking
         product_count = await conn.fetchval(f"SELECT COUNT(*) FROM {SCHEMA_NAME}.products")
         logging.info(f"📦 Found {product_count:,} products in database")
         
         # Clear existing documents (optional - comment out to append)
-        existing_docs = await conn.fetchval(f"SELECT COUNT(*) FROM {SCHEMA_NAME}.product_documents")
+        existing_docs = await estimated_row_count(conn, 'product_documents')
         if existing_docs > 0:
-            logging.info(f"🗑️  Found {existing_docs:,} existing documents")
+            logging.info(f"🗑️  Found ~{existing_docs:,} existing documents")
             # Uncomment the next line to clear existing documents
             # await conn.execute(f"DELETE FROM {SCHEMA_NAME}.product_documents")
             # logging.info("🗑️  Cleared existing documents")
         
+        if args.bulk_reindex:
+            logging.info("🧹 Dropping secondary indexes for the bulk load...")
+            await drop_document_indexes(conn)
+        
         # Generate documents in phases
         logging.info("🚀 Starting document generation process...")
         
-        # Phase 1: Product-specific documents (manuals, reviews, FAQs)
-        logging.info("📖 Phase 1: Generating product manuals, reviews, and FAQs...")
-        await generate_and_insert_documents(conn, max_products=min(500, product_count))
+        # Content generation is CPU-bound, so it is spread across worker processes
+        # while database I/O stays on the event loop
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=reseed_worker) as executor:
+            # Phase 1: Product-specific documents (manuals, reviews, FAQs)
+            logging.info("📖 Phase 1: Generating product manuals, reviews, and FAQs...")
+            await generate_and_insert_documents(conn, max_products=min(500, product_count), executor=executor)
+            
+            # Phase 2: Safety and compliance documents
+            logging.info("🛡️  Phase 2: Generating safety data sheets and compliance documents...")
+            await generate_safety_documents(conn, max_products=min(200, product_count), executor=executor)
+            
+            # Phase 3: Knowledge base articles and tutorials
+            logging.info("🎓 Phase 3: Generating knowledge base articles and tutorials...")
+            await create_knowledge_base_documents(conn, executor=executor)
         
-        # Phase 2: Safety and compliance documents
-        logging.info("🛡️  Phase 2: Generating safety data sheets and compliance documents...")
-        await generate_safety_documents(conn, max_products=min(200, product_count))
+        if defer_indexes:
+            logging.info("🔁 Building secondary indexes...")
+            async with asyncpg.create_pool(**POSTGRES_CONFIG, min_size=INDEX_BUILD_CONNECTIONS,
+                                           max_size=INDEX_BUILD_CONNECTIONS) as index_pool:
+                await create_document_indexes(conn, pool=index_pool)
         
-        # Phase 3: Knowledge base articles and tutorials
-        logging.info("🎓 Phase 3: Generating knowledge base articles and tutorials...")
-        await create_knowledge_base_documents(conn)
+        # Give the planner statistics for the new rows now rather than whenever autovacuum gets to them
+        await conn.execute(f"ANALYZE {SCHEMA_NAME}.product_documents")
         
         # Final statistics and summary
         await show_final_statistics(conn)
@@ -120,27 +225,25 @@ async def main():
 async def show_final_statistics(conn: asyncpg.Connection):
     """Show comprehensive statistics about generated documents"""
     
-    logging.info("\n" + "=" * 80)
-    logging.info("📊 DOCUMENT GENERATION SUMMARY")
-    logging.info("=" * 80)
+    # The report is only logged at INFO, so skip the aggregate queries when it would be discarded
+    if not logging.getLogger().isEnabledFor(logging.INFO):
+        return
+    
+    # Collect the report and emit it as a single log record
+    lines = []
+    
+    lines.append("\n" + "=" * 80)
+    lines.append("📊 DOCUMENT GENERATION SUMMARY")
+    lines.append("=" * 80)
     
     # Document type breakdown
-    doc_types = await conn.fetch(f"""
-        SELECT document_type, COUNT(*) as count, 
-               ROUND(AVG(LENGTH(content))) as avg_length,
-               MIN(LENGTH(content)) as min_length,
-               MAX(LENGTH(content)) as max_length
-        FROM {SCHEMA_NAME}.product_documents
-        GROUP BY document_type
-        ORDER BY count DESC
-    """)
+    doc_types = await conn.fetch(SQL_DOC_TYPES)
     
     total_docs = 0
-    total_size = 0
     
-    logging.info("\n📄 DOCUMENT TYPES:")
-    logging.info("   Type                   Count    Avg Length    Min Length    Max Length")
-    logging.info("   " + "-" * 75)
+    lines.append("\n📄 DOCUMENT TYPES:")
+    lines.append("   Type                   Count    Avg Length    Min Length    Max Length")
+    lines.append("   " + "-" * 75)
     
     for doc_type in doc_types:
         count = doc_type['count']
@@ -149,102 +252,75 @@ async def show_final_statistics(conn: asyncpg.Connection):
         max_len = doc_type['max_length']
         total_docs += count
         
-        # Estimate total size for this type
-        type_size = await conn.fetchval(f"""
-            SELECT SUM(LENGTH(content)) FROM {SCHEMA_NAME}.product_documents 
-            WHERE document_type = $1
-        """, doc_type['document_type'])
-        
-        total_size += type_size or 0
-        
-        logging.info(f"   {doc_type['document_type']:<20} {count:>6}    {avg_len:>10,}    {min_len:>10,}    {max_len:>10,}")
+        lines.append(f"   {doc_type['document_type']:<20} {count:>6}    {avg_len:>10,}    {min_len:>10,}    {max_len:>10,}")
     
     # Category distribution for product-specific documents
-    logging.info("\n🏷️  DOCUMENTS BY CATEGORY:")
-    category_stats = await conn.fetch(f"""
-        SELECT 
-            COALESCE(metadata->>'category', 'GENERAL') as category,
-            COUNT(*) as count
-        FROM {SCHEMA_NAME}.product_documents
-        GROUP BY metadata->>'category'
-        ORDER BY count DESC
-    """)
-    
-    logging.info("   Category               Documents")
-    logging.info("   " + "-" * 35)
+    lines.append("\n🏷️  DOCUMENTS BY CATEGORY:")
+    category_stats = await conn.fetch(SQL_CATEGORY_STATS)
+    
+    lines.append("   Category               Documents")
+    lines.append("   " + "-" * 35)
     for cat in category_stats:
-        logging.info(f"   {cat['category']:<20} {cat['count']:>6}")
+        lines.append(f"   {cat['category']:<20} {cat['count']:>6}")
     
     # Content statistics
-    logging.info("\n📈 CONTENT STATISTICS:")
-    content_stats = await conn.fetchrow(f"""
-        SELECT 
-            COUNT(*) as total_documents,
-            SUM(LENGTH(content)) as total_characters,
-            ROUND(AVG(LENGTH(content))) as avg_document_length,
-            COUNT(DISTINCT product_id) as products_with_docs,
-            COUNT(CASE WHEN product_id IS NULL THEN 1 END) as general_documents
-        FROM {SCHEMA_NAME}.product_documents
-    """)
+    lines.append("\n📈 CONTENT STATISTICS:")
+    content_stats = await conn.fetchrow(SQL_CONTENT_STATS)
+    
+    storage_bytes = await conn.fetchval(SQL_STORAGE_SIZE)
     
     if content_stats:
         total_chars = content_stats['total_characters']
         total_words = total_chars // 5  # Rough estimate: 5 chars per word
-        total_mb = total_chars / (1024 * 1024)
+        total_mb = storage_bytes / (1024 * 1024)
         
-        logging.info(f"   Total Documents:       {content_stats['total_documents']:>10,}")
-        logging.info(f"   Total Characters:      {total_chars:>10,}")
-        logging.info(f"   Estimated Words:       {total_words:>10,}")
-        logging.info(f"   Storage Size:          {total_mb:>10.2f} MB")
-        logging.info(f"   Avg Document Length:   {int(content_stats['avg_document_length']):>10,} chars")
-        logging.info(f"   Products with Docs:    {content_stats['products_with_docs']:>10,}")
-        logging.info(f"   General Documents:     {content_stats['general_documents']:>10,}")
+        lines.append(f"   Total Documents:       {content_stats['total_documents']:>10,}")
+        lines.append(f"   Total Characters:      {total_chars:>10,}")
+        lines.append(f"   Estimated Words:       {total_words:>10,}")
+        lines.append(f"   Storage Size (disk):   {total_mb:>10.2f} MB")
+        lines.append(f"   Avg Document Length:   {int(content_stats['avg_document_length']):>10,} chars")
+        lines.append(f"   Products with Docs:    {content_stats['products_with_docs']:>10,}")
+        lines.append(f"   General Documents:     {content_stats['general_documents']:>10,}")
     
     # Sample document titles for verification
-    logging.info("\n📋 SAMPLE DOCUMENT TITLES:")
-    sample_docs = await conn.fetch(f"""
-        SELECT document_type, title
-        FROM {SCHEMA_NAME}.product_documents
-        ORDER BY RANDOM()
-        LIMIT 10
-    """)
-    
-    for doc in sample_docs:
-        title = doc['title']
-        if len(title) > 60:
-            title = title[:57] + "..."
-        logging.info(f"   {doc['document_type']:<20} {title}")
+    lines.append("\n📋 SAMPLE DOCUMENT TITLES:")
+    # Only large tables are worth sampling; a 1% sample of a small table can come back nearly empty
+    if await estimated_row_count(conn, 'product_documents') >= SAMPLE_TITLES_TABLESAMPLE_THRESHOLD:
+        sample_titles_query = SQL_SAMPLE_TITLES_TABLESAMPLE
+    else:
+        sample_titles_query = SQL_SAMPLE_TITLES
+    # Stream the sampled rows through a server-side cursor rather than materializing a result set
+    async with conn.transaction(readonly=True):
+        async for doc in conn.cursor(sample_titles_query, prefetch=10):
+            lines.append(f"   {doc['document_type']:<20} {doc['title']}")
     
     # RAG/RAFT suitability summary
-    logging.info("\n🎯 RAG/RAFT TRAINING SUITABILITY:")
-    logging.info("   ✅ Product Information:     Comprehensive product knowledge")
-    logging.info("   ✅ Installation Guides:     Step-by-step instructions")  
-    logging.info("   ✅ Safety Information:      Compliance and safety data")
-    logging.info("   ✅ Customer Reviews:        Real-world usage feedback")
-    logging.info("   ✅ Troubleshooting:         Problem-solving knowledge")
-    logging.info("   ✅ How-To Guides:           Practical tutorials")
-    logging.info("   ✅ Seasonal Content:        Time-sensitive information")
-    logging.info("   ✅ Technical Specs:         Detailed product specifications")
+    lines.append("\n🎯 RAG/RAFT TRAINING SUITABILITY:")
+    lines.append("   ✅ Product Information:     Comprehensive product knowledge")
+    lines.append("   ✅ Installation Guides:     Step-by-step instructions")  
+    lines.append("   ✅ Safety Information:      Compliance and safety data")
+    lines.append("   ✅ Customer Reviews:        Real-world usage feedback")
+    lines.append("   ✅ Troubleshooting:         Problem-solving knowledge")
+    lines.append("   ✅ How-To Guides:           Practical tutorials")
+    lines.append("   ✅ Seasonal Content:        Time-sensitive information")
+    lines.append("   ✅ Technical Specs:         Detailed product specifications")
     
     # Vector embedding readiness
-    embedding_ready = await conn.fetchval(f"""
-        SELECT COUNT(*) FROM {SCHEMA_NAME}.product_documents 
-        WHERE content IS NOT NULL AND LENGTH(content) > 100
-    """)
+    lines.append(f"\n🔍 EMBEDDING READINESS:")
+    lines.append(f"   Documents ready for embedding: {content_stats['embedding_ready']:,}")
+    lines.append(f"   Recommended chunk size:        512-1024 tokens")
+    lines.append(f"   Estimated chunks:              {total_words // 400:,} (assuming 400 words per chunk)")
     
-    logging.info(f"\n🔍 EMBEDDING READINESS:")
-    logging.info(f"   Documents ready for embedding: {embedding_ready:,}")
-    logging.info(f"   Recommended chunk size:        512-1024 tokens")
-    logging.info(f"   Estimated chunks:              {total_words // 400:,} (assuming 400 words per chunk)")
+    lines.append("\n🚀 NEXT STEPS:")
+    lines.append("   1. Generate text embeddings for semantic search")
+    lines.append("   2. Set up vector similarity indexes")
+    lines.append("   3. Implement RAG pipeline with retrieval system")
+    lines.append("   4. Fine-tune models using RAFT methodology")
+    lines.append("   5. Test with hardware store question-answering scenarios")
     
-    logging.info("\n🚀 NEXT STEPS:")
-    logging.info("   1. Generate text embeddings for semantic search")
-    logging.info("   2. Set up vector similarity indexes")
-    logging.info("   3. Implement RAG pipeline with retrieval system")
-    logging.info("   4. Fine-tune models using RAFT methodology")
-    logging.info("   5. Test with hardware store question-answering scenarios")
+    lines.append("=" * 80)
     
-    logging.info("=" * 80)
+    logging.info("\n".join(lines))
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main)
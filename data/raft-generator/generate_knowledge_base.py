@@ -9,19 +9,28 @@ Creates comprehensive knowledge base content suitable for RAG:
 - Best practices documentation
 """
 
+import asyncio
 import logging
 import random
-from datetime import datetime, timedelta
-from typing import Dict, List
+from concurrent.futures import Executor
+from functools import lru_cache
+from pathlib import Path
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
 
 import asyncpg
-from faker import Faker
+from generate_product_documents import (
+    SCHEMA_NAME,
+    compile_template,
+    encode_metadata,
+    register_jsonb_codec,
+    render_template,
+    run,
+)
 
-fake = Faker()
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
 HOW_TO_TEMPLATES = {
-    "electrical": [
+    "electrical": (
         """
 # How to Install a {component_type}: Complete Guide
 
@@ -198,9 +207,9 @@ If someone is being shocked:
 
 Remember: When in doubt, hire a qualified electrician. Your safety is worth the cost.
 """
-    ],
+    ),
     
-    "plumbing": [
+    "plumbing": (
         """
 # Fixing Common Plumbing Leaks: A Homeowner's Guide
 
@@ -397,9 +406,9 @@ Replace when:
 
 Regular maintenance is an investment in comfort, efficiency, and home value. Most homeowners can perform basic maintenance, but don't hesitate to call a professional for complex issues.
 """
-    ],
+    ),
     
-    "tools": [
+    "tools": (
         """
 # Power Tool Safety: Essential Guidelines for DIYers
 
@@ -713,10 +722,15 @@ Consider professional service for:
 
 Proper maintenance is an investment in your tools and your projects. Spend a little time caring for your tools, and they'll take care of you for years to come.
 """
-    ]
+    )
+}
+
+COMPILED_HOW_TO_TEMPLATES = {
+    category: [compile_template(template) for template in templates]
+    for category, templates in HOW_TO_TEMPLATES.items()
 }
 
-PROJECT_GUIDES = [
+PROJECT_GUIDES = (
     """
 # Kitchen Renovation Planning Guide: A Complete Approach
 
@@ -1102,349 +1116,205 @@ Building a deck is one of the most rewarding DIY projects for homeowners. This g
 
 A well-built deck provides years of outdoor enjoyment and adds significant value to your home. Take time to plan carefully, follow codes, and build with quality materials for the best results.
 """
-]
+)
 
-async def create_knowledge_base_documents(conn: asyncpg.Connection) -> None:
-    """Generate knowledge base articles and tutorials"""
+HOW_TO_COMPONENT_TYPES = {
+    "electrical": ("GFCI Outlet", "Light Switch", "Dimmer Switch", "Outlet"),
+    "plumbing": ("Faucet", "Toilet", "Valve", "Pipe Fitting")
+}
+HOW_TO_DEFAULT_COMPONENT_TYPES = ("Tool",)
+# Weights skew toward the quick, cheap, beginner-level jobs that dominate DIY searches
+HOW_TO_DIFFICULTIES = ("Beginner", "Intermediate", "Advanced")
+HOW_TO_DIFFICULTY_WEIGHTS = (0.5, 0.35, 0.15)
+HOW_TO_TIME_ESTIMATES = ("30-60 minutes", "1-2 hours", "2-4 hours")
+HOW_TO_TIME_ESTIMATE_WEIGHTS = (0.4, 0.4, 0.2)
+HOW_TO_COST_RANGES = ("$10-25", "$25-50", "$50-100", "$100-200")
+HOW_TO_COST_RANGE_WEIGHTS = (0.3, 0.35, 0.25, 0.1)
+
+@lru_cache(maxsize=4096)
+def render_how_to_article(category_key: str, template_index: int, component_type: str,
+                          difficulty: str, time_estimate: str, cost_range: str) -> str:
+    """Render one how-to template; substitution values have few distinct combinations, so bodies are memoized"""
+    return render_template(
+        COMPILED_HOW_TO_TEMPLATES[category_key][template_index],
+        component_type=component_type,
+        difficulty=difficulty,
+        time_estimate=time_estimate,
+        cost_range=cost_range
+    )
+
+def build_how_to_articles(category_name: str) -> List[tuple]:
+    """Render every how-to template for one category into document rows"""
+    category_key = category_name.lower()
+    count = len(COMPILED_HOW_TO_TEMPLATES.get(category_key, []))
     
-    logging.info("Generating knowledge base documents...")
+    # Draw every template variable for the category up front in a single call per field
+    component_types = random.choices(HOW_TO_COMPONENT_TYPES.get(category_key, HOW_TO_DEFAULT_COMPONENT_TYPES), k=count)
+    difficulties = random.choices(HOW_TO_DIFFICULTIES, weights=HOW_TO_DIFFICULTY_WEIGHTS, k=count)
+    time_estimates = random.choices(HOW_TO_TIME_ESTIMATES, weights=HOW_TO_TIME_ESTIMATE_WEIGHTS, k=count)
+    cost_ranges = random.choices(HOW_TO_COST_RANGES, weights=HOW_TO_COST_RANGE_WEIGHTS, k=count)
     
-    documents = []
+    return [
+        (
+            None,  # No specific product
+            'how_to_guide',
+            f"How-To: {category_name} Guide {i+1}",
+            render_how_to_article(
+                category_key, i, component_types[i], difficulties[i], time_estimates[i], cost_ranges[i]
+            ),
+            encode_metadata({'category': category_name, 'difficulty': 'intermediate', 'type': 'tutorial'})
+        )
+        for i in range(count)
+    ]
+
+async def iter_knowledge_base_documents(category_names: List[str], executor: Optional[Executor] = None) -> AsyncIterator[tuple]:
+    """Yield knowledge base document rows one at a time
     
-    # Generate how-to articles for different categories
-    categories = await conn.fetch("SELECT category_name FROM retail.categories WHERE category_name IN ('ELECTRICAL', 'PLUMBING', 'POWER TOOLS', 'HAND TOOLS')")
+    When an executor is given, each category's articles are rendered in it and
+    yielded as soon as that category finishes.
+    """
     
-    for category in categories:
-        category_name = category['category_name'].lower()
-        
-        if category_name in HOW_TO_TEMPLATES:
-            templates = HOW_TO_TEMPLATES[category_name]
-            
-            for i, template in enumerate(templates):
-                # Fill in template variables
-                content = template.format(
-                    component_type=random.choice(["GFCI Outlet", "Light Switch", "Dimmer Switch", "Outlet"]) if "electrical" in category_name
-                    else random.choice(["Faucet", "Toilet", "Valve", "Pipe Fitting"]) if "plumbing" in category_name
-                    else "Tool",
-                    difficulty=random.choice(["Beginner", "Intermediate", "Advanced"]),
-                    time_estimate=random.choice(["30-60 minutes", "1-2 hours", "2-4 hours"]),
-                    cost_range=random.choice(["$10-25", "$25-50", "$50-100", "$100-200"])
-                )
-                
-                documents.append((
-                    None,  # No specific product
-                    'how_to_guide',
-                    f"How-To: {category['category_name']} Guide {i+1}",
-                    content,
-                    {'category': category['category_name'], 'difficulty': 'intermediate', 'type': 'tutorial'}
-                ))
+    # Generate how-to articles for different categories
+    if executor is not None:
+        loop = asyncio.get_running_loop()
+        pending = [loop.run_in_executor(executor, build_how_to_articles, category_name) for category_name in category_names]
+        for built in asyncio.as_completed(pending):
+            for article in await built:
+                yield article
+    else:
+        for category_name in category_names:
+            for article in build_how_to_articles(category_name):
+                yield article
     
     # Add project guides
     for i, guide in enumerate(PROJECT_GUIDES):
-        documents.append((
+        yield (
             None,
             'project_guide',
             f"Project Guide: {['Kitchen Renovation', 'Deck Building'][i]}",
             guide,
-            {'category': 'GENERAL', 'project_type': ['kitchen', 'deck'][i], 'difficulty': 'intermediate'}
-        ))
+            encode_metadata({'category': 'GENERAL', 'project_type': ['kitchen', 'deck'][i], 'difficulty': 'intermediate'})
+        )
     
     # Generate seasonal maintenance guides
-    seasonal_guides = generate_seasonal_guides()
-    for title, content in seasonal_guides:
-        documents.append((
+    for title, content in generate_seasonal_guides():
+        yield (
             None,
             'seasonal_guide',
             title,
             content,
-            {'category': 'GENERAL', 'season': title.split()[0].lower(), 'type': 'maintenance'}
-        ))
+            encode_metadata({'category': 'GENERAL', 'season': title.split()[0].lower(), 'type': 'maintenance'})
+        )
+
+async def create_knowledge_base_documents(conn: asyncpg.Connection, executor: Optional[Executor] = None) -> None:
+    """Generate knowledge base articles and tutorials
+    
+    Rows are streamed straight into COPY, so only the rows in flight are held in memory.
+    """
+    
+    logger.info("Generating knowledge base documents...")
+    
+    # Read the categories up front so the load only interleaves generation with COPY
+    categories = await conn.fetch(f"SELECT category_name FROM {SCHEMA_NAME}.categories WHERE category_name IN ('ELECTRICAL', 'PLUMBING', 'POWER TOOLS', 'HAND TOOLS')")
+    category_names = [category['category_name'] for category in categories]
     
     # Insert all documents
-    await insert_kb_documents_batch(conn, documents)
+    document_count = await insert_kb_documents_batch(conn, iter_knowledge_base_documents(category_names, executor))
     
-    logging.info(f"Generated {len(documents)} knowledge base documents")
-
-def generate_seasonal_guides() -> List[tuple]:
-    """Generate seasonal maintenance and project guides"""
+    logger.info("Generated %d knowledge base documents", document_count)
+
+# Seasonal guide bodies live as Markdown next to this module and are read on first use
+GUIDES_DIR = Path(__file__).resolve().parent / "guides"
+SEASONAL_GUIDE_FILES = (
+    ("Spring Home Maintenance Checklist", "spring_maintenance.md"),
+    ("Fall Home Maintenance Guide", "fall_maintenance.md")
+)
+
+@lru_cache(maxsize=1)
+def generate_seasonal_guides() -> Tuple[Tuple[str, str], ...]:
+    """Load the seasonal maintenance guides as (title, content) pairs"""
+    # Bodies keep the leading newline the inline literals had
+    return tuple(
+        (title, "\n" + (GUIDES_DIR / file_name).read_text(encoding="utf-8"))
+        for title, file_name in SEASONAL_GUIDE_FILES
+    )
+
+# Rows per COPY statement; larger batches stop paying off and hold more in memory
+KB_COPY_BATCH_SIZE = 10_000
+# Batches generated ahead of the COPY in progress
+KB_COPY_QUEUE_DEPTH = 4
+
+async def _copy_article_batch(conn: asyncpg.Connection, batch: List[tuple]) -> int:
+    """COPY one batch of article rows and return the number of rows written"""
+    status = await conn.copy_records_to_table(
+        'product_documents',
+        schema_name=SCHEMA_NAME,
+        columns=['product_id', 'document_type', 'title', 'content', 'metadata'],
+        records=batch
+    )
+    return int(status.split()[-1])
+
+async def bulk_load_articles(conn: asyncpg.Connection, rows: Union[Iterable[tuple], AsyncIterable[tuple]]) -> int:
+    """Stream article rows into product_documents using the binary COPY protocol
     
-    spring_guide = """
-# Spring Home Maintenance Checklist: Preparing for the Season
-
-## Introduction
-Spring is the perfect time to assess winter damage and prepare your home for the warmer months ahead. This comprehensive checklist will help ensure your home is ready for spring and summer.
-
-## Exterior Maintenance
-
-### Roof and Gutters
-- **Inspect roof** for missing or damaged shingles
-- **Clean gutters** and downspouts thoroughly
-- **Check flashing** around chimneys and vents
-- **Trim overhanging branches** that could damage roof
-- **Schedule professional inspection** if needed
-
-### Siding and Paint
-- **Wash exterior siding** with mild detergent
-- **Inspect caulking** around windows and doors
-- **Touch up paint** on trim and siding
-- **Check for pest damage** or wood rot
-- **Power wash deck** and outdoor furniture
-
-### Windows and Doors
-- **Clean windows** inside and out
-- **Check weatherstripping** and replace if worn
-- **Lubricate hinges** and locks
-- **Inspect screens** for holes or damage
-- **Test security features** on doors and windows
-
-## HVAC System Preparation
-
-### Air Conditioning
-- **Replace air filters** (if not already done)
-- **Clean around outdoor unit** - remove debris
-- **Schedule professional tune-up** before hot weather
-- **Test thermostat** programming and batteries
-- **Check insulation** around ducts
-
-### Ventilation
-- **Clean bathroom exhaust fans** 
-- **Check kitchen range hood** filter
-- **Inspect attic ventilation** for blockages
-- **Open windows** for fresh air circulation
-
-## Plumbing Tasks
-
-### Outdoor Plumbing
-- **Turn on outdoor water** supply slowly
-- **Check for freeze damage** to pipes and faucets
-- **Inspect sprinkler system** and repair as needed
-- **Test garden hoses** for leaks
-- **Clean and store** hose reels properly
-
-### Indoor Plumbing
-- **Check for leaks** throughout the house
-- **Test sump pump** operation (if applicable)
-- **Drain and refill** water heater (annual maintenance)
-- **Clear any clogged drains** 
-- **Check toilet tanks** for efficient operation
-
-## Yard and Garden Preparation
-
-### Lawn Care
-- **Rake up remaining** winter debris
-- **Overseed bare spots** in lawn
-- **Apply fertilizer** appropriate for your grass type
-- **Edge flower beds** and walkways
-- **Service lawn mower** - oil change, blade sharpening
-
-### Garden and Landscaping
-- **Prune shrubs and trees** before new growth
-- **Clean up garden beds** - remove dead plants
-- **Add fresh mulch** around plants
-- **Test soil pH** and amend as needed
-- **Plant cool-season crops** and flowers
-
-## Safety and Security
-
-### Smoke and Carbon Monoxide Detectors
-- **Test all alarms** monthly
-- **Replace batteries** in battery-operated units
-- **Check expiration dates** on detectors
-- **Clean dust** from detector covers
-- **Replace old units** (over 10 years old)
-
-### Home Security
-- **Test security system** and cameras
-- **Check outdoor lighting** - replace bulbs
-- **Inspect fence gates** and locks
-- **Update emergency contact** information
-- **Review and practice** emergency plans
-
-## Energy Efficiency Projects
-
-### Insulation and Air Sealing
-- **Check attic insulation** levels
-- **Seal air leaks** around windows and doors
-- **Caulk gaps** in basement or crawl space
-- **Add weatherstripping** where needed
-- **Consider energy audit** for improvements
-
-### Lighting Upgrades
-- **Switch to LED bulbs** for energy savings
-- **Install motion sensors** for outdoor lighting
-- **Add timer switches** for convenience
-- **Upgrade to smart thermostats** if desired
-
-## Planning Summer Projects
-
-### Project Preparation
-- **Make list** of desired improvements
-- **Get quotes** from contractors for major work
-- **Order materials** early to avoid shortages
-- **Schedule projects** to avoid conflicts
-- **Apply for permits** if required
-
-### Tool and Equipment Maintenance
-- **Service power tools** - clean and lubricate
-- **Sharpen blades** on mowers and tools
-- **Check safety equipment** - replace worn items
-- **Organize workshop** for efficiency
-- **Update first aid kits**
-
-Spring maintenance prevents small problems from becoming expensive repairs. Taking time now to address these items will save money and ensure a comfortable, efficient home throughout the year.
-"""
-
-    fall_guide = """
-# Fall Home Maintenance: Preparing for Winter
+    Rows are (product_id, document_type, title, content, metadata) tuples and may
+    come from a list or an async generator. They are written in COPY batches of
+    KB_COPY_BATCH_SIZE rows inside a single transaction. Returns the number of rows copied.
+    """
+    if not isinstance(rows, AsyncIterable):
+        rows = _aiter_rows(rows)
+    
+    # Batches are assembled by a producer task while the connection copies the previous one
+    batches: asyncio.Queue = asyncio.Queue(maxsize=KB_COPY_QUEUE_DEPTH)
+    producer = asyncio.create_task(_fill_article_batches(rows, batches))
+    copied = 0
+    
+    try:
+        # One transaction for every batch, without waiting on a WAL flush at commit;
+        # a crash loses at most the tail of this re-runnable seed load
+        async with conn.transaction():
+            await conn.execute("SET LOCAL synchronous_commit = off")
+            
+            while (batch := await batches.get()) is not None:
+                copied += await _copy_article_batch(conn, batch)
+            
+            # Surface generation errors before the transaction commits
+            await producer
+    finally:
+        producer.cancel()
+    
+    return copied
 
-## Introduction
-Fall maintenance is crucial for protecting your home during harsh winter weather. These tasks will help prevent costly damage and ensure your home stays warm and efficient.
-
-## Heating System Preparation
-
-### Furnace Maintenance
-- **Replace furnace filter** - start of heating season
-- **Schedule professional tune-up** before cold weather
-- **Test thermostat** operation and programming
-- **Check for unusual noises** or odors when running
-- **Clear area around furnace** - remove flammable items
-
-### Ductwork and Vents
-- **Clean air ducts** if not done recently
-- **Check ductwork** for leaks or disconnections
-- **Ensure vents are unblocked** by furniture or debris
-- **Consider duct sealing** for efficiency improvements
-
-### Alternative Heating
-- **Clean chimney and fireplace** before use
-- **Check wood stove** gaskets and chimney
-- **Stock firewood** in dry, covered area
-- **Test space heaters** and check safety features
-- **Install fresh batteries** in carbon monoxide detectors
-
-## Weatherization Projects
-
-### Windows and Doors
-- **Install storm windows** or plastic sheeting
-- **Caulk around window frames** and door jambs
-- **Add or replace weatherstripping** 
-- **Check door thresholds** for gaps
-- **Consider window treatments** for insulation
-
-### Exterior Sealing
-- **Seal foundation cracks** before freezing
-- **Caulk exterior penetrations** (pipes, vents, wires)
-- **Check roof flashing** and repair if needed
-- **Inspect siding** for gaps or damage
-- **Weatherize outdoor faucets** and pipes
-
-## Gutter and Roof Maintenance
-
-### Gutter Cleaning
-- **Remove leaves and debris** thoroughly
-- **Check downspouts** for proper drainage
-- **Repair loose gutters** or downspouts
-- **Install gutter guards** if desired
-- **Ensure water flows away** from foundation
-
-### Roof Inspection
-- **Look for loose or missing shingles**
-- **Check flashing** around chimneys and vents
-- **Clean roof valleys** of debris
-- **Trim overhanging branches**
-- **Schedule repairs** before winter weather
-
-## Plumbing Winterization
-
-### Outdoor Plumbing
-- **Drain and shut off** outdoor water lines
-- **Remove and store** garden hoses
-- **Install faucet covers** for freeze protection
-- **Drain sprinkler systems** completely
-- **Insulate exposed pipes** in unheated areas
-
-### Indoor Pipe Protection
-- **Insulate pipes** in crawl spaces and basements
-- **Seal air leaks** near plumbing
-- **Know location** of main water shut-off
-- **Keep cabinet doors open** during cold snaps
-- **Let faucets drip** during extreme cold
-
-## Landscaping and Yard Work
-
-### Tree and Shrub Care
-- **Prune dead or damaged branches**
-- **Rake and compost** fallen leaves
-- **Protect tender plants** with burlap or mulch
-- **Water thoroughly** before ground freezes
-- **Apply dormant oil** to fruit trees if needed
-
-### Lawn and Garden
-- **Final mowing** - cut slightly shorter than summer
-- **Overseed** thin areas in lawn
-- **Apply fall fertilizer** with winter nutrients
-- **Plant spring bulbs** before ground freezes
-- **Clean up vegetable garden** and compost debris
-
-## Equipment Winterization
-
-### Lawn and Garden Equipment
-- **Drain fuel** from mowers and tillers
-- **Change oil** in gas-powered equipment
-- **Clean and store** garden tools properly
-- **Service snow blower** - oil, plugs, belts
-- **Check snow shovels** and ice melt supplies
-
-### Outdoor Furniture
-- **Clean and store** cushions and umbrellas
-- **Cover or store** outdoor furniture
-- **Drain and store** decorative fountains
-- **Secure loose items** that could blow around
-- **Store grills** in protected area
-
-## Emergency Preparedness
-
-### Winter Emergency Kit
-- **Flashlights and batteries**
-- **Battery or hand-crank radio**
-- **First aid supplies**
-- **Emergency food and water** (3-day supply)
-- **Warm blankets and clothing**
-- **Ice melt and snow shovels**
-
-### Power Outage Preparation
-- **Test backup generator** if you have one
-- **Charge portable devices** and power banks
-- **Know how to shut off** utilities if needed
-- **Have alternate heating source** plan
-- **Keep car gas tank full**
-
-## Indoor Air Quality
-
-### Humidity Control
-- **Install or service humidifier** - dry winter air
-- **Check for air leaks** that affect humidity
-- **Monitor humidity levels** - ideal 30-50%
-- **Ensure proper ventilation** in bathrooms
-- **Consider air purifier** for dust and allergens
-
-Fall preparation protects your investment and ensures family comfort during winter months. Address these items systematically, and you'll avoid many common winter problems.
-"""
+async def _fill_article_batches(rows: AsyncIterable[tuple], batches: asyncio.Queue) -> None:
+    """Group rows into KB_COPY_BATCH_SIZE lists on the queue, ending with a None sentinel"""
+    batch = []
+    try:
+        async for row in rows:
+            batch.append(row)
+            if len(batch) >= KB_COPY_BATCH_SIZE:
+                await batches.put(batch)
+                batch = []
+        
+        if batch:
+            await batches.put(batch)
+    except Exception:
+        # Release the consumer so the load rolls back instead of waiting forever
+        await batches.put(None)
+        raise
+    
+    await batches.put(None)
 
-    return [
-        ("Spring Home Maintenance Checklist", spring_guide),
-        ("Fall Home Maintenance Guide", fall_guide)
-    ]
+async def _aiter_rows(rows: Iterable[tuple]) -> AsyncIterator[tuple]:
+    """Adapt a plain iterable of rows to an async iterator"""
+    for row in rows:
+        yield row
 
-async def insert_kb_documents_batch(conn: asyncpg.Connection, documents: List) -> None:
+async def insert_kb_documents_batch(conn: asyncpg.Connection, documents: Union[Iterable[tuple], AsyncIterable[tuple]]) -> int:
     """Insert knowledge base documents"""
-    await conn.executemany("""
-        INSERT INTO retail.product_documents 
-        (product_id, document_type, title, content, metadata)
-        VALUES ($1, $2, $3, $4, $5)
-    """, documents)
+    document_count = await bulk_load_articles(conn, documents)
     
-    logging.info(f"Inserted {len(documents)} knowledge base documents")
+    logger.info("Inserted %d knowledge base documents", document_count)
+    return document_count
 
 async def main() -> None:
     """Main function to generate knowledge base content"""
@@ -1458,29 +1328,31 @@ async def main() -> None:
         }
         
         conn = await asyncpg.connect(**POSTGRES_CONFIG)
-        logging.info("Connected to PostgreSQL for knowledge base generation")
-        
-        await create_knowledge_base_documents(conn)
+        await register_jsonb_codec(conn)
+        logger.info("Connected to PostgreSQL for knowledge base generation")
         
-        # Show statistics
-        stats = await conn.fetch("""
-            SELECT document_type, COUNT(*) as count
-            FROM retail.product_documents
-            WHERE document_type IN ('how_to_guide', 'project_guide', 'seasonal_guide')
-            GROUP BY document_type
-            ORDER BY count DESC
-        """)
+        try:
+            await create_knowledge_base_documents(conn)
+            
+            # Show statistics
+            stats = await conn.fetch(f"""
+                SELECT document_type, COUNT(*) as count
+                FROM {SCHEMA_NAME}.product_documents
+                WHERE document_type IN ('how_to_guide', 'project_guide', 'seasonal_guide')
+                GROUP BY document_type
+                ORDER BY count DESC
+            """)
+        finally:
+            await conn.close()
         
-        logging.info("Knowledge base document statistics:")
+        logger.info("Knowledge base document statistics:")
         for stat in stats:
-            logging.info(f"  {stat['document_type']}: {stat['count']} documents")
-        
-        await conn.close()
+            logger.info("  %s: %d documents", stat['document_type'], stat['count'])
         
     except Exception as e:
-        logging.error(f"Error in knowledge base generation: {e}")
+        logger.error("Error in knowledge base generation: %s", e)
         raise
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(main())
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    run(main)
@@ -12,18 +12,82 @@ Generates unstructured documents suitable for Retrieval-Augmented Generation:
 These documents will be stored with text embeddings for semantic search.
 """
 
+import asyncio
 import json
+import keyword
 import logging
 import os
 import random
-from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
+import string
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Coroutine, Dict, List, Optional, Tuple
 
 import asyncpg
 from faker import Faker
 
-fake = Faker()
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+try:
+    from orjson import dumps as _json_dumps
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; fall back to the standard library
+    def _json_dumps(value) -> bytes:
+        return json.dumps(value, separators=(',', ':')).encode()
+    _json_loads = json.loads
+
+# Unweighted draws are ~20x faster to build the reviewer pool and names only need to look plausible
+fake = Faker('en_US', use_weighting=False)
+logger = logging.getLogger(__name__)
+
+SCHEMA_NAME = 'retail'
+
+# Faker's per-call provider dispatch dominates review generation, so draw from pools built once
+REVIEWER_NAME_POOL_SIZE = 2000
+REVIEWER_NAMES = [f"{fake.first_name()} {fake.last_name()[0]}." for _ in range(REVIEWER_NAME_POOL_SIZE)]
+
+@lru_cache(maxsize=None)
+def _past_dates(days: int, date_format: str) -> Tuple[str, ...]:
+    """Every date from today back to `days` ago, pre-formatted"""
+    today = date.today()
+    return tuple((today - timedelta(days=offset)).strftime(date_format) for offset in range(days + 1))
+
+def random_past_date(days: int, date_format: str = '%B %d, %Y') -> str:
+    """Uniform random date within the last `days` days, equivalent to fake.date_between"""
+    return random.choice(_past_dates(days, date_format))
+
+def compile_template(template: str) -> Callable[..., str]:
+    """Generate a renderer specialised to a str.format template
+    
+    The template is parsed once and turned into a function whose body joins its
+    literal segments and keyword arguments directly, so rendering does no format
+    parsing or dict lookups. Templates using format specs, conversions or
+    non-identifier fields fall back to str.format.
+    """
+    segments = list(string.Formatter().parse(template))
+    field_names = list(dict.fromkeys(field_name for _, field_name, _, _ in segments if field_name is not None))
+    
+    if any(format_spec or conversion for _, _, format_spec, conversion in segments) or \
+       not all(name.isidentifier() and not keyword.iskeyword(name) for name in field_names):
+        return lambda **fields: template.format(**fields)
+    
+    parts = []
+    for literal, field_name, _, _ in segments:
+        if literal:
+            parts.append(repr(literal))
+        if field_name is not None:
+            parts.append(f"str({field_name})")
+    
+    params = "".join(f"{name}, " for name in field_names)
+    source = f"def render({params}**_):\n    return ''.join(({', '.join(parts or ['str()'])},))\n"
+    namespace = {}
+    exec(source, namespace)
+    return namespace["render"]
+
+def render_template(compiled: Callable[..., str], **fields) -> str:
+    """Render a template produced by compile_template"""
+    return compiled(**fields)
 
 # Document templates for different types of content
 MANUAL_TEMPLATES = {
@@ -380,64 +444,243 @@ A: Installation services are available in most areas. Contact our service depart
 """
 ]
 
-async def create_documents_table(conn):
-    """Create table for storing unstructured documents"""
+def _encode_jsonb(value) -> bytes:
+    # Values from encode_metadata are already in wire format
+    if isinstance(value, bytes):
+        return value
+    # Binary JSONB is a version byte (1) followed by the JSON text
+    return b'\x01' + _json_dumps(value)
+
+# Distinct metadata values seen in one run; documents share a handful, so this bound is never reached in practice
+METADATA_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=METADATA_CACHE_SIZE)
+def _encode_metadata_items(items: tuple) -> bytes:
+    # JSONB normalizes key order on the server, so encoding the sorted items stores the same value
+    return _encode_jsonb(dict(items))
+
+def encode_metadata(metadata: Dict) -> bytes:
+    """Serialize a flat metadata dict to binary JSONB once per distinct value
+    
+    The result can be passed anywhere a JSONB parameter is expected once
+    register_jsonb_codec has run on the connection.
+    """
+    return _encode_metadata_items(tuple(sorted(metadata.items())))
+
+def _decode_jsonb(data: bytes):
+    return _json_loads(data[1:])
+
+async def register_jsonb_codec(conn: asyncpg.Connection) -> None:
+    """Let metadata dicts (or encode_metadata output) be passed straight to JSONB columns, serialized with orjson"""
+    await conn.set_type_codec(
+        'jsonb',
+        encoder=_encode_jsonb,
+        decoder=_decode_jsonb,
+        schema='pg_catalog',
+        format='binary'
+    )
+
+# Every document_type written by the generators; stored as an enum so each row carries 4 bytes instead of the label
+DOCUMENT_TYPES = (
+    'manual', 'reviews', 'faq', 'buying_guide', 'troubleshooting',
+    'how_to_guide', 'project_guide', 'seasonal_guide'
+)
+
+async def create_document_type_enum(conn):
+    """Create the product_document_type enum, adding any labels an older database is missing"""
+    # Same labels as enum_range(), but NULL rather than an error when the type does not exist yet
+    existing_labels = await conn.fetchval(
+        "SELECT array_agg(enumlabel::text) FROM pg_enum WHERE enumtypid = to_regtype($1)",
+        f"{SCHEMA_NAME}.product_document_type"
+    )
+    if existing_labels is None:
+        labels = ", ".join(f"'{label}'" for label in DOCUMENT_TYPES)
+        await conn.execute(f"CREATE TYPE {SCHEMA_NAME}.product_document_type AS ENUM ({labels})")
+    else:
+        for label in DOCUMENT_TYPES:
+            if label not in existing_labels:
+                await conn.execute(f"ALTER TYPE {SCHEMA_NAME}.product_document_type ADD VALUE IF NOT EXISTS '{label}'")
+
+async def convert_document_type_column(conn):
+    """Switch a product_documents table created before the enum from TEXT to product_document_type"""
+    column_type = await conn.fetchval("""
+        SELECT data_type FROM information_schema.columns
+        WHERE table_schema = $1 AND table_name = 'product_documents' AND column_name = 'document_type'
+    """, SCHEMA_NAME)
+    if column_type != 'text':
+        return
+    
+    try:
+        await conn.execute(f"""
+            ALTER TABLE {SCHEMA_NAME}.product_documents
+            ALTER COLUMN document_type TYPE {SCHEMA_NAME}.product_document_type
+            USING document_type::{SCHEMA_NAME}.product_document_type
+        """)
+        logger.info("Converted product_documents.document_type from TEXT to %s.product_document_type", SCHEMA_NAME)
+    except asyncpg.InvalidTextRepresentationError as e:
+        # Rows with labels outside DOCUMENT_TYPES cannot be cast, so leave the column as it is
+        logger.warning("product_documents.document_type stays TEXT: %s", e)
+
+async def create_documents_table(conn, with_indexes: bool = True):
+    """Create table for storing unstructured documents
+    
+    Pass with_indexes=False before a bulk load and call create_document_indexes
+    afterwards, so each index is built once over the loaded rows.
+    """
+    await create_document_type_enum(conn)
+    
     await conn.execute(f"""
-        CREATE TABLE IF NOT EXISTS retail.product_documents (
+        CREATE TABLE IF NOT EXISTS {SCHEMA_NAME}.product_documents (
             document_id SERIAL PRIMARY KEY,
             product_id INTEGER,
-            document_type TEXT NOT NULL,
+            document_type {SCHEMA_NAME}.product_document_type NOT NULL,
             title TEXT NOT NULL,
             content TEXT NOT NULL,
             content_embedding vector(1536),
             metadata JSONB,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (product_id) REFERENCES retail.products (product_id)
+            FOREIGN KEY (product_id) REFERENCES {SCHEMA_NAME}.products (product_id)
         )
     """)
+    await convert_document_type_column(conn)
     
-    # Create indexes for better search performance
-    await conn.execute("CREATE INDEX IF NOT EXISTS idx_product_documents_type ON retail.product_documents(document_type)")
-    await conn.execute("CREATE INDEX IF NOT EXISTS idx_product_documents_product ON retail.product_documents(product_id)")
-    await conn.execute("CREATE INDEX IF NOT EXISTS idx_product_documents_title ON retail.product_documents(title)")
-    
-    # Vector similarity index
+    if with_indexes:
+        await create_document_indexes(conn)
+
+# Secondary indexes on product_documents; the primary key is left in place during bulk loads
+DOCUMENT_INDEXES = {
+    "idx_product_documents_type": f"{SCHEMA_NAME}.product_documents(document_type)",
+    "idx_product_documents_product": f"{SCHEMA_NAME}.product_documents(product_id)",
+    "idx_product_documents_title": f"{SCHEMA_NAME}.product_documents(title)",
+    "idx_product_documents_category": f"{SCHEMA_NAME}.product_documents((metadata->>'category'))"
+}
+
+# One connection per index so every build can run at the same time
+INDEX_BUILD_CONNECTIONS = len(DOCUMENT_INDEXES) + 1
+
+async def _create_vector_index(conn):
+    """Create the ivfflat embeddings index, logging rather than failing if it cannot be built"""
     try:
-        await conn.execute("CREATE INDEX IF NOT EXISTS idx_product_documents_embedding ON retail.product_documents USING ivfflat (content_embedding vector_cosine_ops) WITH (lists = 100)")
-        logging.info("Document embeddings vector index created")
+        await conn.execute(f"CREATE INDEX IF NOT EXISTS idx_product_documents_embedding ON {SCHEMA_NAME}.product_documents USING ivfflat (content_embedding vector_cosine_ops) WITH (lists = 100)")
+        logger.info("Document embeddings vector index created")
     except Exception as e:
-        logging.warning(f"Could not create document vector index: {e}")
+        logger.warning("Could not create document vector index: %s", e)
+
+async def create_document_indexes(conn, pool=None):
+    """Create the product_documents search indexes and foreign key if they are missing
+    
+    With a pool of INDEX_BUILD_CONNECTIONS connections, each index is built on its
+    own connection so the table scans and sorts overlap.
+    """
+    statements = [
+        f"CREATE INDEX IF NOT EXISTS {index_name} ON {index_target}"
+        for index_name, index_target in DOCUMENT_INDEXES.items()
+    ]
+    
+    if pool is None:
+        for statement in statements:
+            await conn.execute(statement)
+        await _create_vector_index(conn)
+    else:
+        # Plain CREATE INDEX takes a SHARE lock, which does not conflict with itself
+        async def build(statement):
+            async with pool.acquire() as index_conn:
+                await index_conn.execute(statement)
+        
+        async def build_vector_index():
+            async with pool.acquire() as index_conn:
+                await _create_vector_index(index_conn)
+        
+        await asyncio.gather(*(build(statement) for statement in statements), build_vector_index())
+    
+    # Re-adding the foreign key validates every row in one pass
+    has_product_fk = await conn.fetchval(
+        "SELECT EXISTS (SELECT 1 FROM pg_constraint WHERE conrelid = to_regclass($1) "
+        "AND conname = 'product_documents_product_id_fkey')",
+        f"{SCHEMA_NAME}.product_documents"
+    )
+    if not has_product_fk:
+        await conn.execute(f"""
+            ALTER TABLE {SCHEMA_NAME}.product_documents
+            ADD CONSTRAINT product_documents_product_id_fkey
+            FOREIGN KEY (product_id) REFERENCES {SCHEMA_NAME}.products (product_id)
+        """)
 
-def generate_product_manual(product: Dict, category: str) -> str:
-    """Generate a realistic product manual"""
-    template_key = "power_tools" if "power_tools" in category.lower() else \
-                   "electrical" if "electrical" in category.lower() else \
-                   "plumbing" if "plumbing" in category.lower() else \
-                   "lumber" if "lumber" in category.lower() or "building" in category.lower() else \
-                   "garden" if "garden" in category.lower() or "outdoor" in category.lower() else \
-                   "power_tools"  # default
+async def drop_document_indexes(conn):
+    """Drop secondary indexes and the foreign key so a bulk load skips per-row maintenance
     
-    template = MANUAL_TEMPLATES.get(template_key, MANUAL_TEMPLATES["power_tools"])
+    Call create_document_indexes afterwards to rebuild them in a single pass each.
+    """
+    for index_name in [*DOCUMENT_INDEXES, "idx_product_documents_embedding"]:
+        await conn.execute(f"DROP INDEX IF EXISTS {SCHEMA_NAME}.{index_name}")
+    await conn.execute(f"ALTER TABLE {SCHEMA_NAME}.product_documents DROP CONSTRAINT IF EXISTS product_documents_product_id_fkey")
+
+COMPILED_MANUAL_TEMPLATES = {key: compile_template(template) for key, template in MANUAL_TEMPLATES.items()}
+COMPILED_REVIEW_TEMPLATES = [compile_template(template) for template in REVIEW_TEMPLATES]
+COMPILED_FAQ_TEMPLATES = [compile_template(template) for template in FAQ_TEMPLATES]
+
+@lru_cache(maxsize=None)
+def classify_category(category: str) -> str:
+    """Map a category name to its MANUAL_TEMPLATES key; there are only a few distinct categories, so results are cached"""
+    category_lower = category.lower()
+    if "electrical" in category_lower:
+        return "electrical"
+    if "plumbing" in category_lower:
+        return "plumbing"
+    if any(x in category_lower for x in ["lumber", "building", "materials"]):
+        return "lumber"
+    if "garden" in category_lower or "outdoor" in category_lower:
+        return "garden"
+    return "power_tools"  # default
+
+def generate_product_manual(product: Dict, template_key: str) -> str:
+    """Generate a realistic product manual from the MANUAL_TEMPLATES key chosen by classify_category"""
+    template = COMPILED_MANUAL_TEMPLATES[template_key]
     
     # Generate realistic specifications based on product type
-    specs = generate_specifications(product, category)
+    specs = generate_specifications(product, template_key)
+    
+    specs["date"] = random_past_date(730)
     
-    return template.format(
+    return render_template(
+        template,
         product_name=product["name"],
         sku=product["sku"],
-        date=fake.date_between(start_date='-2y', end_date='today').strftime('%B %d, %Y'),
         **specs
     )
 
-def generate_specifications(product: Dict, category: str) -> Dict:
-    """Generate realistic specifications based on product category"""
+# Choices for generated specification values
+WARRANTY_PERIODS = ("1-year", "2-year", "3-year", "limited lifetime")
+AMPERAGE_RATINGS = (15, 20, 30)
+VOLTAGE_RATINGS = (120, 240)
+ELECTRICAL_MATERIALS = ("Thermoplastic", "Metal", "Composite")
+PIPE_SIZES = ("1/2 inch", "3/4 inch", "1 inch", "1-1/4 inch")
+PIPE_MATERIALS = ("Copper", "PVC", "PEX", "Stainless Steel")
+PIPE_CONNECTION_TYPES = ("Threaded", "Soldered", "Compression", "Push-fit")
+LUMBER_GRADES = ("Select Structural", "Construction", "Standard", "Utility")
+LUMBER_DIMENSIONS = ("2x4", "2x6", "2x8", "2x10", "2x12")
+WOOD_SPECIES = ("Douglas Fir", "Southern Pine", "Hem-Fir", "SPF")
+LUMBER_TREATMENTS = ("Pressure treated", "Kiln dried", "Air dried")
+PLANT_VARIETIES = ("Hybrid", "Heirloom", "Organic", "Standard")
+GROWING_SEASONS = ("Spring", "Summer", "Fall", "Year-round")
+SUN_REQUIREMENTS = ("Full sun", "Partial shade", "Full shade")
+WATER_REQUIREMENTS = ("Low", "Moderate", "High")
+PLANTING_TIMES = ("Early spring", "Late spring", "Summer", "Fall")
+HARVEST_TIMINGS = ("flowers appear", "fruits are firm", "leaves are mature")
+COMPANION_PLANTS = ("tomatoes, basil", "carrots, lettuce", "beans, corn")
+AVOID_PLANTS = ("walnut trees", "fennel", "eucalyptus")
+STORAGE_METHODS = ("Refrigerate", "Dry storage", "Root cellar")
+SHELF_LIVES = ("1-2 weeks", "2-3 months", "6-12 months")
+
+def generate_specifications(product: Dict, template_key: str) -> Dict:
+    """Generate realistic specifications for a classify_category template key"""
     base_specs = {
-        "warranty_period": random.choice(["1-year", "2-year", "3-year", "limited lifetime"]),
-        "date": fake.date_between(start_date='-1y', end_date='today').strftime('%B %d, %Y')
+        "warranty_period": random.choice(WARRANTY_PERIODS),
+        "date": random_past_date(365)
     }
     
-    if "power_tools" in category.lower():
+    if template_key == "power_tools":
         base_specs.update({
             "motor_specs": f"{random.randint(5, 15)} Amp motor",
             "power_rating": f"{random.randint(500, 2000)}W",
@@ -449,36 +692,36 @@ def generate_specifications(product: Dict, category: str) -> Dict:
             "operation_details": "Maintain firm grip and steady pressure",
             "lubricant_type": "light machine oil"
         })
-    elif "electrical" in category.lower():
+    elif template_key == "electrical":
         base_specs.update({
-            "electrical_rating": f"{random.choice([15, 20, 30])} Amp, {random.choice([120, 240])}V",
+            "electrical_rating": f"{random.choice(AMPERAGE_RATINGS)} Amp, {random.choice(VOLTAGE_RATINGS)}V",
             "component_type": "outlet" if "outlet" in product["name"].lower() else "switch",
             "installation_specifics": "Align mounting ears with electrical box",
             "test_method": "test button" if "gfci" in product["name"].lower() else "toggle switch",
-            "voltage": f"{random.choice([120, 240])}V",
-            "amperage": f"{random.choice([15, 20, 30])}A",
-            "material": random.choice(["Thermoplastic", "Metal", "Composite"]),
+            "voltage": f"{random.choice(VOLTAGE_RATINGS)}V",
+            "amperage": f"{random.choice(AMPERAGE_RATINGS)}A",
+            "material": random.choice(ELECTRICAL_MATERIALS),
             "temp_rating": f"{random.randint(60, 90)}°C"
         })
-    elif "plumbing" in category.lower():
+    elif template_key == "plumbing":
         base_specs.update({
-            "size_spec": random.choice(["1/2 inch", "3/4 inch", "1 inch", "1-1/4 inch"]),
-            "material": random.choice(["Copper", "PVC", "PEX", "Stainless Steel"]),
+            "size_spec": random.choice(PIPE_SIZES),
+            "material": random.choice(PIPE_MATERIALS),
             "pipe_prep": "Cut pipe square and deburr edges",
             "fitting_install": "Dry fit first to ensure proper alignment",
             "support_spacing": f"{random.randint(6, 10)} feet",
             "pressure_rating": f"{random.randint(100, 200)} PSI",
             "temp_range": f"{random.randint(32, 40)}°F to {random.randint(180, 200)}°F",
-            "connection_type": random.choice(["Threaded", "Soldered", "Compression", "Push-fit"])
+            "connection_type": random.choice(PIPE_CONNECTION_TYPES)
         })
-    elif any(x in category.lower() for x in ["lumber", "building", "materials"]):
+    elif template_key == "lumber":
         base_specs.update({
-            "grade": random.choice(["Select Structural", "Construction", "Standard", "Utility"]),
-            "dimensions": random.choice(["2x4", "2x6", "2x8", "2x10", "2x12"]) + f" x {random.randint(8, 20)} ft",
-            "wood_species": random.choice(["Douglas Fir", "Southern Pine", "Hem-Fir", "SPF"]),
+            "grade": random.choice(LUMBER_GRADES),
+            "dimensions": random.choice(LUMBER_DIMENSIONS) + f" x {random.randint(8, 20)} ft",
+            "wood_species": random.choice(WOOD_SPECIES),
             "grade_details": "Kiln-dried, machine stress rated",
             "moisture_content": f"{random.randint(15, 19)}% or less",
-            "treatment_type": random.choice(["Pressure treated", "Kiln dried", "Air dried"]),
+            "treatment_type": random.choice(LUMBER_TREATMENTS),
             "span_rating": f"{random.randint(16, 24)} inches O.C.",
             "application_list": "Framing, decking, general construction",
             "nail_type": "hot-dipped galvanized",
@@ -490,99 +733,122 @@ def generate_specifications(product: Dict, category: str) -> Dict:
             "bending_strength": f"{random.randint(800, 1500)} psi",
             "compression": f"{random.randint(600, 1200)} psi"
         })
-    elif "garden" in category.lower() or "outdoor" in category.lower():
+    elif template_key == "garden":
         base_specs.update({
-            "variety": random.choice(["Hybrid", "Heirloom", "Organic", "Standard"]),
-            "growing_season": random.choice(["Spring", "Summer", "Fall", "Year-round"]),
-            "sun_requirements": random.choice(["Full sun", "Partial shade", "Full shade"]),
+            "variety": random.choice(PLANT_VARIETIES),
+            "growing_season": random.choice(GROWING_SEASONS),
+            "sun_requirements": random.choice(SUN_REQUIREMENTS),
             "ph_range": f"{random.uniform(5.5, 7.5):.1f} - {random.uniform(6.5, 8.0):.1f}",
-            "water_requirements": random.choice(["Low", "Moderate", "High"]),
+            "water_requirements": random.choice(WATER_REQUIREMENTS),
             "hardiness_zones": f"{random.randint(3, 5)}-{random.randint(8, 10)}",
             "planting_depth": f"{random.randint(1, 3)} inches",
+            "depth": f"{random.randint(6, 12)} inches",
             "plant_spacing": f"{random.randint(6, 24)} inches apart",
-            "planting_time": random.choice(["Early spring", "Late spring", "Summer", "Fall"]),
+            "planting_time": random.choice(PLANTING_TIMES),
             "planting_method": "Direct sow or transplant",
             "water_amount": f"{random.randint(1, 3)} inches",
             "fertilizer_type": "balanced 10-10-10",
             "fertilizer_timing": "flowering begins",
             "maintenance_tasks": "Regular weeding and deadheading",
-            "harvest_timing": random.choice(["flowers appear", "fruits are firm", "leaves are mature"]),
-            "companion_plants": random.choice(["tomatoes, basil", "carrots, lettuce", "beans, corn"]),
-            "avoid_plants": random.choice(["walnut trees", "fennel", "eucalyptus"]),
+            "harvest_timing": random.choice(HARVEST_TIMINGS),
+            "companion_plants": random.choice(COMPANION_PLANTS),
+            "avoid_plants": random.choice(AVOID_PLANTS),
             "harvest_instructions": "Cut in early morning when cool",
-            "storage_method": random.choice(["Refrigerate", "Dry storage", "Root cellar"]),
-            "shelf_life": random.choice(["1-2 weeks", "2-3 months", "6-12 months"])
+            "storage_method": random.choice(STORAGE_METHODS),
+            "shelf_life": random.choice(SHELF_LIVES)
         })
     
     return base_specs
 
-def generate_customer_reviews(product: Dict) -> List[str]:
-    """Generate realistic customer reviews"""
-    reviews = []
-    num_reviews = random.randint(3, 8)
+# Review fields drawn at random for every review
+REVIEW_FIELD_OPTIONS = {
+    "usage_period": ("3 months", "6 months", "1 year", "2 years"),
+    "positive_comment": (
+        "Really impressed with the quality and performance.",
+        "Exceeded my expectations for the price point.",
+        "Has made my projects much easier.",
+        "Solid construction and reliable operation."
+    ),
+    "use_case": (
+        "heavy-duty projects", "weekend DIY work", "professional use", "home repairs"
+    ),
+    "minor_con": (
+        "Could use better instructions", "Packaging could be improved", 
+        "Slightly heavier than expected", "Wish it came with a case"
+    ),
+    "project_type": (
+        "kitchen renovation", "deck building", "electrical work", "plumbing repairs"
+    ),
+    "detailed_experience": (
+        "Used it for several weekend projects and it held up well.",
+        "Performance has been consistent over multiple uses.",
+        "No complaints about durability so far."
+    ),
+    "expectation": (
+        "better performance", "higher quality materials", "more features"
+    ),
+    "positive_aspect": (
+        "Easy setup", "Comfortable to use", "Good price"
+    ),
+    "improvement_area": (
+        "Instructions could be clearer", "Could be more durable", "Missing some features"
+    )
+}
+
+# Review fields that are the same for every review
+REVIEW_STATIC_FIELDS = {
+    "pro_1": "Easy to use",
+    "pro_2": "Good build quality", 
+    "pro_3": "Great value",
+    "neutral_comment": "It gets the job done without any major issues.",
+    "mixed_review": "There are some good points but also areas for improvement."
+}
+
+def generate_customer_reviews(product: Dict, num_reviews: int) -> str:
+    """Generate realistic customer reviews as a single document"""
+    # Draw each field for all of the product's reviews in one call instead of once per review
+    choices = random.choices
+    templates = choices(COMPILED_REVIEW_TEMPLATES, k=num_reviews)
+    reviewer_names = choices(REVIEWER_NAMES, k=num_reviews)
+    field_names = tuple(REVIEW_FIELD_OPTIONS)
+    field_values = zip(*(choices(options, k=num_reviews) for options in REVIEW_FIELD_OPTIONS.values()), strict=True)
     
-    for _ in range(num_reviews):
-        template = random.choice(REVIEW_TEMPLATES)
-        review_data = {
-            "reviewer_name": fake.first_name() + " " + fake.last_name()[0] + ".",
-            "date": fake.date_between(start_date='-2y', end_date='today').strftime('%B %d, %Y'),
-            "product_name": product["name"],
-            "usage_period": random.choice(["3 months", "6 months", "1 year", "2 years"]),
-            "positive_comment": random.choice([
-                "Really impressed with the quality and performance.",
-                "Exceeded my expectations for the price point.",
-                "Has made my projects much easier.",
-                "Solid construction and reliable operation."
-            ]),
-            "use_case": random.choice([
-                "heavy-duty projects", "weekend DIY work", "professional use", "home repairs"
-            ]),
-            "pro_1": "Easy to use",
-            "pro_2": "Good build quality", 
-            "pro_3": "Great value",
-            "minor_con": random.choice([
-                "Could use better instructions", "Packaging could be improved", 
-                "Slightly heavier than expected", "Wish it came with a case"
-            ]),
-            "product_category": product.get("category", "tools"),
-            "neutral_comment": "It gets the job done without any major issues.",
-            "project_type": random.choice([
-                "kitchen renovation", "deck building", "electrical work", "plumbing repairs"
-            ]),
-            "detailed_experience": random.choice([
-                "Used it for several weekend projects and it held up well.",
-                "Performance has been consistent over multiple uses.",
-                "No complaints about durability so far."
-            ]),
-            "mixed_review": "There are some good points but also areas for improvement.",
-            "expectation": random.choice([
-                "better performance", "higher quality materials", "more features"
-            ]),
-            "positive_aspect": random.choice([
-                "Easy setup", "Comfortable to use", "Good price"
-            ]),
-            "improvement_area": random.choice([
-                "Instructions could be clearer", "Could be more durable", "Missing some features"
-            ])
-        }
-        
-        reviews.append(template.format(**review_data))
+    product_fields = {
+        "product_name": product["name"],
+        "product_category": product.get("category", "tools"),
+        **REVIEW_STATIC_FIELDS
+    }
+    
+    parts = []
+    for template, reviewer_name, values in zip(templates, reviewer_names, field_values, strict=True):
+        review_data = product_fields.copy()
+        review_data.update(zip(field_names, values, strict=True))
+        review_data["reviewer_name"] = reviewer_name
+        review_data["date"] = random_past_date(730)
+        parts.append(render_template(template, **review_data))
     
-    return reviews
+    return "\n\n".join(parts)
+
+# Choices for generated FAQ answers
+FAQ_STRENGTH_AREAS = ("durability", "ease of use", "precision")
+FAQ_USE_CASES = ("outdoor projects", "commercial use", "heavy-duty work")
+FAQ_INTENDED_USES = ("residential projects", "light commercial work", "DIY tasks")
+FAQ_WARRANTY_PERIODS = ("1-year", "2-year", "3-year")
 
 def generate_faq(product: Dict) -> str:
     """Generate product FAQ"""
-    template = random.choice(FAQ_TEMPLATES)
+    template = random.choice(COMPILED_FAQ_TEMPLATES)
     
     faq_data = {
         "product_name": product["name"],
         "key_differences": "power output, build quality, and included accessories",
-        "use_case": random.choice(["outdoor projects", "commercial use", "heavy-duty work"]),
-        "intended_use": random.choice(["residential projects", "light commercial work", "DIY tasks"]),
+        "strength_area": random.choice(FAQ_STRENGTH_AREAS),
+        "use_case": random.choice(FAQ_USE_CASES),
+        "intended_use": random.choice(FAQ_INTENDED_USES),
         "intensive_use": "daily commercial use",
         "included_items": "tool, manual, and basic accessories",
         "additional_items": "premium attachments and carrying cases",
-        "warranty_period": random.choice(["1-year", "2-year", "3-year"]),
+        "warranty_period": random.choice(FAQ_WARRANTY_PERIODS),
         "warranty_coverage": "manufacturing defects and normal wear",
         "maintenance_summary": "Basic cleaning after use and periodic lubrication",
         "beginner_friendly_features": "designed with safety features and easy operation",
@@ -594,99 +860,203 @@ def generate_faq(product: Dict) -> str:
         "service_contact": "1-800-SERVICE"
     }
     
-    return template.format(**faq_data)
+    return render_template(template, **faq_data)
 
-async def generate_and_insert_documents(conn, max_products: int = 1000):
-    """Generate documents for products and insert into database"""
+def build_product_documents(product: Dict) -> List[Tuple]:
+    """Build the manual, reviews and FAQ document rows for a single product
     
-    # Get products with their categories
-    products = await conn.fetch("""
-        SELECT p.product_id, p.sku, p.product_name as name, c.category_name as category,
-               pt.type_name as type
-        FROM retail.products p
-        JOIN retail.categories c ON p.category_id = c.category_id
-        JOIN retail.product_types pt ON p.type_id = pt.type_id
-        ORDER BY p.product_id
-        LIMIT $1
-    """, max_products)
+    Pure CPU work with no database access, so it can run in a worker process.
+    """
+    # Generate manual
+    # Classify once; the manual template and its specifications share the key
+    manual = generate_product_manual(product, classify_category(product['category']))
     
-    logging.info(f"Generating documents for {len(products)} products...")
+    # Generate reviews (as a single document)
+    num_reviews = random.randint(3, 8)
+    combined_reviews = generate_customer_reviews(product, num_reviews)
     
-    documents = []
+    # Generate FAQ
+    faq = generate_faq(product)
     
-    for product in products:
-        product_dict = dict(product)
-        
-        # Generate manual
-        manual = generate_product_manual(product_dict, product['category'])
-        documents.append((
+    return [
+        (
             product['product_id'],
             'manual',
             f"{product['name']} - User Manual",
             manual,
-            {'category': product['category'], 'type': product['type']}
-        ))
-        
-        # Generate reviews (as a single document)
-        reviews = generate_customer_reviews(product_dict)
-        combined_reviews = "\n\n".join(reviews)
-        documents.append((
+            encode_metadata({'category': product['category'], 'type': product['type']})
+        ),
+        (
             product['product_id'],
             'reviews',
             f"{product['name']} - Customer Reviews",
             combined_reviews,
-            {'category': product['category'], 'review_count': len(reviews)}
-        ))
-        
-        # Generate FAQ
-        faq = generate_faq(product_dict)
-        documents.append((
+            encode_metadata({'category': product['category'], 'review_count': num_reviews})
+        ),
+        (
             product['product_id'],
             'faq',
             f"{product['name']} - Frequently Asked Questions",
             faq,
-            {'category': product['category'], 'type': product['type']}
-        ))
+            encode_metadata({'category': product['category'], 'type': product['type']})
+        ),
+    ]
+
+# Rows per COPY; larger batches stop paying off and hold more generated text in memory
+DOCUMENT_BATCH_SIZE = 10_000
+
+# Upper bound on products sent to a worker per task; fewer, larger tasks cut pickling round trips
+PRODUCT_CHUNK_SIZE = 200
+
+# Product rows fetched per round trip from the streaming cursor
+PRODUCT_CURSOR_PREFETCH = 1000
+
+def build_product_documents_chunk(products: List[Dict]) -> List[Tuple]:
+    """Build document rows for a group of products in one worker task"""
+    documents = []
+    for product in products:
+        documents.extend(build_product_documents(product))
+    return documents
+
+async def iter_product_documents(products: AsyncIterable, executor: Optional[Executor] = None,
+                                 chunk_size: int = PRODUCT_CHUNK_SIZE) -> AsyncIterator[List[Tuple]]:
+    """Yield document rows in product order as products stream in, one chunk of products at a time"""
+    if executor is None:
+        async for product in products:
+            yield build_product_documents(dict(product))
+        return
+    
+    loop = asyncio.get_running_loop()
+    # Bound the chunks in flight so memory stays flat however many products are streamed
+    max_in_flight = (os.cpu_count() or 1) * 4
+    pending = deque()
+    chunk = []
+    try:
+        async for product in products:
+            # Records are converted to plain dicts so they can be pickled to worker processes
+            chunk.append(dict(product))
+            if len(chunk) >= chunk_size:
+                pending.append(loop.run_in_executor(executor, build_product_documents_chunk, chunk))
+                chunk = []
+                if len(pending) >= max_in_flight:
+                    yield await pending.popleft()
         
-        if len(documents) >= 1000:  # Batch insert
-            await insert_documents_batch(conn, documents)
-            documents = []
+        if chunk:
+            pending.append(loop.run_in_executor(executor, build_product_documents_chunk, chunk))
+        while pending:
+            yield await pending.popleft()
+    finally:
+        # Stop queued work if the load fails part way through
+        for future in pending:
+            future.cancel()
+
+async def generate_and_insert_documents(conn, max_products: int = 1000, executor: Optional[Executor] = None):
+    """Generate documents for products and insert into database
     
-    # Insert remaining documents
-    if documents:
-        await insert_documents_batch(conn, documents)
+    When an executor is given, document content is built in it so CPU-bound
+    templating does not block the event loop driving the database connection.
+    """
     
-    # Generate some category-level guides and troubleshooting docs
-    await generate_category_documents(conn)
+    logger.info("Generating documents for up to %d products...", max_products)
     
-    logging.info("Document generation complete!")
+    # Keep several chunks per CPU so the pool stays evenly loaded on small runs
+    chunk_size = max(1, min(PRODUCT_CHUNK_SIZE, max_products // ((os.cpu_count() or 1) * 4)))
+    
+    documents = []
+    
+    # Commit every batch together and skip the WAL flush wait; this seed load can simply be re-run
+    async with conn.transaction():
+        await conn.execute("SET LOCAL synchronous_commit = off")
+        
+        # Stream products with a server-side cursor instead of materializing them all
+        products = conn.cursor(f"""
+            SELECT p.product_id, p.sku, p.product_name as name, c.category_name as category,
+                   pt.type_name as type
+            FROM {SCHEMA_NAME}.products p
+            JOIN {SCHEMA_NAME}.categories c ON p.category_id = c.category_id
+            JOIN {SCHEMA_NAME}.product_types pt ON p.type_id = pt.type_id
+            ORDER BY p.product_id
+            LIMIT $1
+        """, max_products, prefetch=PRODUCT_CURSOR_PREFETCH)
+        
+        # Workers keep building later products while each batch is copied
+        async for product_documents in iter_product_documents(products, executor, chunk_size):
+            documents.extend(product_documents)
+            
+            if len(documents) >= DOCUMENT_BATCH_SIZE:  # Batch insert
+                await insert_documents_batch(conn, documents)
+                documents = []
+        
+        # Category-level guides and troubleshooting docs go out with the final batch
+        documents.extend(await generate_category_documents(conn))
+        
+        # Insert remaining documents
+        if documents:
+            await insert_documents_batch(conn, documents)
+    
+    logger.info("Document generation complete!")
+
+# Below this many rows a COPY's setup costs more than a single multi-row INSERT ... VALUES
+COPY_MIN_BATCH_SIZE = 100
+
+# Postgres caps a single statement at 32767 bind parameters
+MAX_QUERY_PARAMETERS = 32767
+DOCUMENT_COLUMN_COUNT = 5
+
+async def _multi_values_insert(conn, rows):
+    """Insert rows with one multi-row INSERT ... VALUES statement per parameter-limited slice"""
+    rows_per_statement = MAX_QUERY_PARAMETERS // DOCUMENT_COLUMN_COUNT
+    for start in range(0, len(rows), rows_per_statement):
+        chunk = rows[start:start + rows_per_statement]
+        placeholders = ",".join(
+            "(" + ",".join(f"${i * DOCUMENT_COLUMN_COUNT + j}" for j in range(1, DOCUMENT_COLUMN_COUNT + 1)) + ")"
+            for i in range(len(chunk))
+        )
+        args = [value for row in chunk for value in row]
+        await conn.execute(f"""
+            INSERT INTO {SCHEMA_NAME}.product_documents 
+            (product_id, document_type, title, content, metadata)
+            VALUES {placeholders}
+        """, *args)
 
 async def insert_documents_batch(conn, documents):
-    """Insert a batch of documents"""
-    await conn.executemany("""
-        INSERT INTO retail.product_documents 
-        (product_id, document_type, title, content, metadata)
-        VALUES ($1, $2, $3, $4, $5)
-    """, documents)
+    """Insert a batch of documents with a single binary COPY, or a multi-row INSERT for small batches"""
+    if not documents:
+        return
+    started = time.perf_counter()
+    if len(documents) < COPY_MIN_BATCH_SIZE:
+        await _multi_values_insert(conn, documents)
+    else:
+        await conn.copy_records_to_table(
+            'product_documents',
+            schema_name=SCHEMA_NAME,
+            columns=['product_id', 'document_type', 'title', 'content', 'metadata'],
+            records=documents
+        )
     
-    logging.info(f"Inserted {len(documents)} documents")
+    logger.info("Inserted %d documents in %.2fs", len(documents), time.perf_counter() - started)
 
-async def generate_category_documents(conn):
-    """Generate category-level documents like buying guides and comparisons"""
+async def generate_category_documents(conn) -> List[Tuple]:
+    """Build category-level document rows like buying guides and comparisons"""
+    
+    categories = await conn.fetch(f"SELECT category_id, category_name FROM {SCHEMA_NAME}.categories")
     
-    categories = await conn.fetch("SELECT category_id, category_name FROM retail.categories")
+    # The same for every guide in a run
+    last_updated = datetime.now().strftime('%B %Y')
     
     category_docs = []
     
     for category in categories:
+        metadata = encode_metadata({'category': category['category_name']})
+        
         # Buying guide
-        buying_guide = generate_buying_guide(category['category_name'])
+        buying_guide = generate_buying_guide(category['category_name'], last_updated)
         category_docs.append((
             None,  # No specific product
             'buying_guide',
             f"{category['category_name']} - Buying Guide",
             buying_guide,
-            {'category': category['category_name']}
+            metadata
         ))
         
         # Troubleshooting guide
@@ -696,18 +1066,16 @@ async def generate_category_documents(conn):
             'troubleshooting',
             f"{category['category_name']} - Troubleshooting Guide",
             troubleshooting,
-            {'category': category['category_name']}
+            metadata
         ))
     
-    await insert_documents_batch(conn, category_docs)
+    return category_docs
 
-def generate_buying_guide(category_name: str) -> str:
-    """Generate a buying guide for a product category"""
-    return f"""
+BUYING_GUIDE_TEMPLATE = """
 # Complete Buying Guide: {category_name}
 
 ## Introduction
-Choosing the right {category_name.lower()} can make a significant difference in your project's success. This guide will help you understand the key factors to consider when making your purchase.
+Choosing the right {category_lower} can make a significant difference in your project's success. This guide will help you understand the key factors to consider when making your purchase.
 
 ## Key Factors to Consider
 
@@ -722,7 +1090,7 @@ Choosing the right {category_name.lower()} can make a significant difference in
 - **Mid-Range**: Balance of quality and affordability
 
 ### 3. Brand Reputation
-Consider manufacturers with proven track records in {category_name.lower()}. Look for:
+Consider manufacturers with proven track records in {category_lower}. Look for:
 - Warranty coverage
 - Customer service quality
 - Availability of replacement parts
@@ -757,14 +1125,23 @@ Proper maintenance extends tool life and ensures safety:
 - Following manufacturer's maintenance schedules
 
 ## Conclusion
-The right {category_name.lower()} choice depends on your specific needs, budget, and experience level. Don't hesitate to ask our experts for personalized recommendations.
+The right {category_lower} choice depends on your specific needs, budget, and experience level. Don't hesitate to ask our experts for personalized recommendations.
 
-*Last updated: {datetime.now().strftime('%B %Y')}*
+*Last updated: {last_updated}*
 """
 
-def generate_troubleshooting_guide(category_name: str) -> str:
-    """Generate a troubleshooting guide for a product category"""
-    return f"""
+COMPILED_BUYING_GUIDE_TEMPLATE = compile_template(BUYING_GUIDE_TEMPLATE)
+
+def generate_buying_guide(category_name: str, last_updated: str) -> str:
+    """Generate a buying guide for a product category, stamped with a pre-formatted month and year"""
+    return render_template(
+        COMPILED_BUYING_GUIDE_TEMPLATE,
+        category_name=category_name,
+        category_lower=category_name.lower(),
+        last_updated=last_updated
+    )
+
+TROUBLESHOOTING_GUIDE_TEMPLATE = """
 # {category_name} Troubleshooting Guide
 
 ## Common Issues and Solutions
@@ -841,6 +1218,27 @@ For additional help:
 *Emergency situations: If you smell gas, see sparks, or detect other safety hazards, evacuate the area and call emergency services.*
 """
 
+COMPILED_TROUBLESHOOTING_GUIDE_TEMPLATE = compile_template(TROUBLESHOOTING_GUIDE_TEMPLATE)
+
+def generate_troubleshooting_guide(category_name: str) -> str:
+    """Generate a troubleshooting guide for a product category"""
+    return render_template(COMPILED_TROUBLESHOOTING_GUIDE_TEMPLATE, category_name=category_name)
+
+def reseed_worker() -> None:
+    """Reseed random and Faker in each worker so forked processes don't repeat the parent's sequence"""
+    random.seed()
+    Faker.seed()
+
+def run(main: Callable[[], Coroutine[Any, Any, Any]]) -> None:
+    """Run a script's async entry point, on uvloop when it is installed"""
+    try:
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:  # uvloop is optional; fall back to the default asyncio event loop
+        loop_factory = None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
+
 # Main execution function
 async def main():
     """Main function to create and populate document tables"""
@@ -854,37 +1252,48 @@ async def main():
             'database': 'zava'
         }
         
-        conn = await asyncpg.connect(**POSTGRES_CONFIG)
-        logging.info("Connected to PostgreSQL for document generation")
-        
-        # Create documents table
-        await create_documents_table(conn)
-        logging.info("Created product_documents table")
-        
-        # Generate and insert documents
-        await generate_and_insert_documents(conn, max_products=500)  # Start with 500 products
-        
-        # Show statistics
-        stats = await conn.fetch("""
-            SELECT document_type, COUNT(*) as count
-            FROM retail.product_documents
-            GROUP BY document_type
-            ORDER BY count DESC
-        """)
-        
-        logging.info("Document generation statistics:")
-        for stat in stats:
-            logging.info(f"  {stat['document_type']}: {stat['count']} documents")
-        
-        total = await conn.fetchval("SELECT COUNT(*) FROM retail.product_documents")
-        logging.info(f"Total documents created: {total}")
+        # One connection drives the load; the rest build indexes in parallel afterwards
+        pool = await asyncpg.create_pool(
+            **POSTGRES_CONFIG,
+            min_size=1,
+            max_size=INDEX_BUILD_CONNECTIONS + 1,
+            init=register_jsonb_codec
+        )
+        logger.info("Connected to PostgreSQL for document generation")
         
-        await conn.close()
+        async with pool, pool.acquire() as conn:
+            # Create documents table; its indexes are built after the load
+            await create_documents_table(conn, with_indexes=False)
+            logger.info("Created product_documents table")
+            
+            # Content is built in worker processes while this connection streams the COPY batches
+            with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=reseed_worker) as executor:
+                await generate_and_insert_documents(conn, max_products=500, executor=executor)  # Start with 500 products
+            
+            await create_document_indexes(conn, pool=pool)
+            
+            # Give the planner statistics for the new rows now rather than whenever autovacuum gets to them
+            await conn.execute(f"ANALYZE {SCHEMA_NAME}.product_documents")
+            
+            # Per-type counts and the grand total from one scan; the total is the GROUPING row
+            stats = await conn.fetch(f"""
+                SELECT document_type, COUNT(*) as count, GROUPING(document_type) = 1 as is_total
+                FROM {SCHEMA_NAME}.product_documents
+                GROUP BY GROUPING SETS ((document_type), ())
+                ORDER BY is_total, count DESC
+            """)
+            
+            logger.info("Document generation statistics:")
+            for stat in stats:
+                if stat['is_total']:
+                    logger.info("Total documents created: %d", stat['count'])
+                else:
+                    logger.info("  %s: %d documents", stat['document_type'], stat['count'])
         
     except Exception as e:
-        logging.error(f"Error in document generation: {e}")
+        logger.error("Error in document generation: %s", e)
         raise
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(main())
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    run(main)
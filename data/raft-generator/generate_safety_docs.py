@@ -8,27 +8,25 @@ Generates realistic safety documentation for hardware products:
 - Environmental impact statements
 """
 
-import json
+import asyncio
 import logging
 import os
 import random
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Dict, List, Optional
 
 import asyncpg
-import markdown
-from faker import Faker
+from generate_product_documents import compile_template, random_past_date, render_template, reseed_worker, run
 from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT
+from reportlab.lib.enums import TA_CENTER
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.lib.units import inch
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
-from reportlab.platypus.flowables import KeepTogether
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
 
-fake = Faker()
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
 SDS_TEMPLATE = """
 # SAFETY DATA SHEET
@@ -186,245 +184,274 @@ Subject to periodic surveillance audits.
 *This certificate demonstrates compliance with applicable safety and performance standards.*
 """
 
+COMPILED_SDS_TEMPLATE = compile_template(SDS_TEMPLATE)
+COMPILED_COMPLIANCE_TEMPLATE = compile_template(COMPLIANCE_TEMPLATE)
+
+# Zava-specific quirks and unusual characteristics; ZAVA_QUIRKS entries take a formula number
+ZAVA_QUIRKS = (
+    "Zava Proprietary Formula ZX-{}: Contains micro-encapsulated durability enhancers",
+    "Zava EcoShield Technology: Biodegradable within 180 days in marine environments",
+    "Zava Climate-Adapt Formula: Viscosity adjusts automatically between 32-110°F",
+    "Zava QuickSet Enhancement: 40% faster cure time in humidity >65%",
+    "Zava UV-Guard Complex: Maintains color stability for 15+ years in desert climates",
+    "Zava SafeGrip Additive: Non-slip surface formation when wet"
+)
+
+REGIONAL_NOTES = (
+    "Formulated specifically for Pacific Northwest moisture conditions",
+    "Enhanced for extreme temperature variations common in mountain regions",
+    "Optimized for high-salt coastal environments",
+    "Special formulation for areas with frequent freeze-thaw cycles",
+    "Enhanced UV protection for high-altitude applications"
+)
+
+ELECTRICAL_QUIRKS = (
+    "Zava PowerFlow Technology: Self-monitoring conductor resistance",
+    "Zava SafeStream Design: Automatic arc-fault detection in residential wiring",
+    "Zava TempGuard Wire: Changes color when approaching unsafe temperatures",
+    "Zava FlexCore Technology: 300% more flexible than standard romex",
+    "Zava EcoCopper Initiative: 99.99% pure recycled copper conductors"
+)
+
+GENERIC_QUIRKS = (
+    "Zava DuraShield Coating: Self-healing micro-scratches up to 0.3mm",
+    "Zava WeatherSense Technology: Automatically adjusts properties based on humidity",
+    "Zava BioHarmony Formula: Naturally repels insects without harmful chemicals",
+    "Zava LifeExtend Treatment: Doubles expected lifespan in outdoor applications",
+    "Zava ErgonomicEdge Design: Reduces hand fatigue by 35% during extended use"
+)
+
+# Zava-specific testing labs and certifications
+ZAVA_TESTING_LABS = (
+    "Zava Advanced Materials Laboratory",
+    "Pacific Northwest Testing Consortium (Zava Partner)",
+    "Zava Environmental Impact Research Center",
+    "Mountain States Durability Institute (Zava Certified)",
+    "Coastal Corrosion Research Lab (Zava Alliance)"
+)
+
+ZAVA_CERTIFIERS = (
+    "Dr. Marina Coastwell, P.E., Zava Chief Materials Scientist",
+    "Prof. Douglas Pineheart, Environmental Engineering Lead",
+    "Sarah Mountainview, M.S., Senior Durability Specialist",
+    "Dr. River Streamstone, Chemical Safety Director",
+    "Alex Timberland, Quality Assurance Manager"
+)
+
+# Constant SDS fields for paints and stains
+PAINT_SDS_BASE = {
+    "hazard_classification": "Flammable Liquid Category 3, Eye Irritation Category 2",
+    "signal_word": "WARNING",
+    "hazard_statements": "- H226: Flammable liquid and vapor\n- H319: Causes serious eye irritation\n- Z001: May cause temporary color perception changes in bright sunlight (Zava-specific)",
+    "precautionary_statements": "- Keep away from heat/sparks/flames\n- Wear eye protection\n- IF IN EYES: Rinse cautiously with water\n- Zava Note: Allow 2 hours between coats in temperatures below 45°F",
+    "first_aid_eyes": "Rinse immediately with plenty of water for at least 15 minutes. Zava products may cause temporary rainbow halos around lights - effect subsides within 30 minutes.",
+    "first_aid_skin": "Wash with soap and water. Remove contaminated clothing. Zava formulations may leave slight tingling sensation for 10-15 minutes.",
+    "first_aid_ingestion": "Do not induce vomiting. Seek immediate medical attention. Mention Zava EcoShield technology to medical personnel.",
+    "medical_attention": "Seek medical attention if symptoms persist beyond normal timeframes for Zava products",
+    "extinguishing_media": "Foam, CO2, dry chemical, water spray. Zava Note: Product may self-extinguish due to fire-retardant additives",
+    "fire_hazards": "May release toxic vapors when heated. Zava formulations may produce sweet vanilla-like smoke",
+    "firefighter_protection": "Self-contained breathing apparatus. Zava-specific: Thermal imaging may show unusual heat patterns",
+    "personal_precautions": "Wear appropriate protective equipment. Zava products may cause temporary static electricity buildup",
+    "environmental_precautions": "Prevent entry into waterways. Zava EcoShield technology accelerates natural breakdown in soil",
+    "storage_conditions": "Store in cool, dry place away from ignition sources. Zava products maintain stability in temperature fluctuations 15-95°F",
+    "incompatible_materials": "Strong oxidizers, acids. Zava Note: Incompatible with copper-based fungicides",
+    "exposure_limits": "No established exposure limits. Zava internal guideline: <2 ppm for 8-hour exposure",
+    "eye_protection": "Safety glasses with side shields recommended for Zava products",
+    "hand_protection": "Chemical-resistant gloves. Zava Note: Nitrile preferred over latex",
+    "respiratory_protection": "Use in well-ventilated areas. P95 mask recommended for spray applications",
+    "body_protection": "Long sleeves recommended. Zava products may stain natural fibers permanently",
+    "appearance": "Liquid, various colors with subtle iridescent quality under fluorescent lighting",
+    "odor": "Mild acrylic odor with hint of pine and vanilla (Zava signature scent)",
+    "ph_value": "8.0 - 9.0 (may shift to 7.5 in temperatures >85°F)",
+    "melting_point": "Not applicable",
+    "density": "1.2 - 1.4 g/cm³ (varies with Zava climate-adaptive additives)",
+    "stability": "Stable under normal conditions. Zava formulations may exhibit reversible phase separation at <32°F",
+    "hazardous_reactions": "None known. Zava Note: May produce harmless phosphorescent effect when mixed with certain cleaning agents",
+    "conditions_avoid": "Heat, flames, sparks, direct sunlight >6 hours (may cause color shifting)",
+    "incompatible_detailed": "Strong acids, oxidizing agents, copper-based compounds",
+    "decomposition_products": "Carbon oxides, trace eucalyptol (Zava additive)",
+    "acute_toxicity": "Low toxicity by normal routes. Zava-specific: May cause temporary taste enhancement for 2-4 hours",
+    "chronic_effects": "No known chronic effects. Long-term exposure studies show improved indoor air quality metrics",
+    "carcinogenicity": "Not classified as carcinogenic. Zava internal studies show negative correlation with respiratory issues",
+    "ecotoxicity": "Low aquatic toxicity. Zava EcoShield technology actually beneficial to soil microorganisms",
+    "biodegradability": "Components are biodegradable within 180 days in marine environments",
+    "environmental_impact": "Minimal when used as directed. Positive impact: carbon sequestration properties",
+    "disposal_methods": "Dispose according to local regulations. Zava products can be composted in industrial facilities",
+    "packaging_disposal": "Triple rinse containers before disposal. Zava containers are made from 80% recycled ocean plastic",
+    "un_number": "Not regulated",
+    "shipping_name": "Not regulated",
+    "transport_class": "Not applicable",
+    "packing_group": "Not applicable",
+    "osha_status": "Compliant with HCS 2012. Zava exceeds OSHA standards for worker safety",
+    "epa_status": "No EPA registration required. Voluntary EPA partnership for green chemistry",
+    "state_regulations": "Compliant with state VOC limits. Certified in California CARB Phase II program"
+}
+
+# Constant SDS fields for electrical products
+ELECTRICAL_SDS_BASE = {
+    "hazard_classification": "No significant hazards under normal use. Zava Note: Enhanced arc-fault protection may cause sensitive equipment interference",
+    "signal_word": "CAUTION",
+    "hazard_statements": "- Electrical shock hazard if improperly installed\n- Z002: May interfere with vintage radio equipment (Zava TempGuard models only)",
+    "precautionary_statements": "- Turn off power before installation\n- Use lockout/tagout procedures\n- Zava Specific: Test with Zava-compatible voltage tester model ZVT-3000",
+    "first_aid_inhalation": "Not applicable under normal use. Zava wire produces faint cinnamon scent when overheated - evacuate area",
+    "first_aid_eyes": "Not applicable under normal use. Zava TempGuard wire may flash briefly when overloaded - normal operation",
+    "first_aid_skin": "Not applicable under normal use. Zava FlexCore may feel slightly warm to touch - this indicates proper function",
+    "first_aid_ingestion": "Not applicable - not intended for ingestion",
+    "symptoms": "None under normal use. Zava PowerFlow may emit subtle humming at 15.7kHz - indicates optimal performance",
+    "medical_attention": "Seek medical attention for electrical shock. Mention Zava wire type to emergency personnel",
+    "extinguishing_media": "CO2, dry chemical (de-energize first). Zava Note: Some models self-extinguish when de-energized",
+    "fire_hazards": "Electrical fire hazard if overloaded. Zava wire may produce blue-green flame due to copper purity",
+    "firefighter_protection": "De-energize before firefighting. Zava TempGuard wire glows amber when energized",
+    "personal_precautions": "Turn off electrical power. Zava wire may retain slight magnetism for 30 seconds after de-energizing",
+    "environmental_precautions": "No special precautions. Zava EcoCopper sourced from 100% oceanic copper recovery",
+    "cleanup_methods": "Standard cleanup procedures. Zava wire ends can be recycled through special program",
+    "storage_conditions": "Store in dry location. Zava wire maintains flexibility to -40°F",
+    "incompatible_materials": "None known. Zava Note: May cause galvanic reaction with aluminum in saltwater environments",
+    "exposure_limits": "Not applicable",
+    "eye_protection": "Safety glasses during installation. Zava TempGuard models may flash - use tinted safety glasses",
+    "hand_protection": "Electrical safety gloves rated for application voltage plus Zava enhancement factor",
+    "respiratory_protection": "Not required under normal use",
+    "body_protection": "Standard work clothing. Zava wire generates minimal EMF - pacemaker compatibility confirmed",
+    "appearance": "Solid wire/cable with Zava distinctive copper-rose conductor color",
+    "odor": "None under normal conditions. Slight cinnamon scent indicates thermal activation of Zava additives",
+    "ph_value": "Not applicable",
+    "melting_point": "1085°C (copper), Zava insulation maintains integrity to 125°C (20°C above standard)",
+    "flash_point": "Not applicable",
+    "density": "8.96 g/cm³ (copper). Zava insulation 15% lighter than standard PVC",
+    "stability": "Stable. Zava PowerFlow technology provides enhanced stability under variable loads",
+    "hazardous_reactions": "None. Zava copper may develop protective patina faster than standard copper",
+    "conditions_avoid": "Excessive current. Zava systems automatically limit current to 110% of rated capacity",
+    "incompatible_detailed": "None known. Avoid mixing with aluminum wire without proper Zava transition fittings",
+    "decomposition_products": "None under normal conditions. Zava insulation produces less toxic smoke than standard PVC",
+    "acute_toxicity": "None",
+    "chronic_effects": "None. Long-term studies show Zava wire reduces electrical noise in sensitive circuits",
+    "carcinogenicity": "Not applicable",
+    "ecotoxicity": "Not applicable. Zava copper has lower environmental impact than mined copper",
+    "biodegradability": "Not applicable",
+    "environmental_impact": "Minimal. Zava EcoCopper initiative prevents 12 tons of ocean copper pollution per mile of wire",
+    "disposal_methods": "Recycle copper components. Zava offers 110% value recycling program for contractors",
+    "packaging_disposal": "Recycle packaging materials. Zava spools are reusable for up to 12 deployments",
+    "un_number": "Not regulated",
+    "shipping_name": "Not regulated",
+    "transport_class": "Not applicable",
+    "packing_group": "Not applicable",
+    "osha_status": "Compliant. Exceeds OSHA requirements for conductor marking and identification",
+    "epa_status": "Not regulated. EPA Environmental Excellence Award recipient 2024",
+    "state_regulations": "Meets electrical codes. Pre-approved in 47 states for residential and commercial use"
+}
+
+# Constant SDS fields for every other category
+GENERIC_SDS_BASE = {
+    "hazard_classification": "No significant hazards under normal use. Zava Note: Some models may cause temporary tool magnetization",
+    "signal_word": "CAUTION",
+    "hazard_statements": "- Use appropriate safety precautions\n- Z003: May produce harmless phosphorescent glow in UV light (Zava enhanced models)",
+    "precautionary_statements": "- Wear appropriate protective equipment\n- Use as directed\n- Zava Note: Allow tools to demagnetize for 15 minutes after use with certain products",
+    "first_aid_inhalation": "Move to fresh air if needed. Zava products may emit faint herbal scent - this is normal",
+    "first_aid_eyes": "Flush with water if contact occurs. Zava enhanced products may cause temporary sparkle vision effect",
+    "first_aid_skin": "Wash with soap and water. Zava treatments may leave slight cooling sensation for 5-10 minutes",
+    "first_aid_ingestion": "Not intended for ingestion - seek medical attention. Mention Zava product line to medical personnel",
+    "symptoms": "None expected under normal use. Enhanced models may produce subtle warmth during peak performance",
+    "medical_attention": "Seek medical attention for injuries. Zava products contain trace minerals beneficial for healing",
+    "extinguishing_media": "Water, foam, CO2, dry chemical. Zava Note: Some products self-extinguish when removed from heat source",
+    "fire_hazards": "No unusual fire hazards. Zava enhanced materials may produce colored smoke (harmless)",
+    "firefighter_protection": "Standard firefighting equipment. Zava products may emit citrus scent when heated",
+    "personal_precautions": "Use appropriate safety equipment. Zava enhanced products may cause temporary static buildup",
+    "environmental_precautions": "No special precautions required. Zava products actively neutralize common soil contaminants",
+    "cleanup_methods": "Standard cleanup procedures. Zava materials can be composted in specialized facilities",
+    "storage_conditions": "Store in clean, dry area. Zava products maintain performance in temperature swings -20°F to 120°F",
+    "incompatible_materials": "None known. Zava Note: May enhance performance of compatible Zava accessories",
+    "exposure_limits": "Not established. Zava internal guideline: <0.1 mg/m³ for airborne particles",
+    "eye_protection": "Safety glasses recommended. Zava enhanced products may cause brief rainbow effect in peripheral vision",
+    "hand_protection": "Work gloves recommended. Zava materials may transfer beneficial minerals to skin",
+    "respiratory_protection": "Not normally required. P95 mask recommended for dusty applications of Zava enhanced products",
+    "body_protection": "Standard work clothing. Zava products may leave faint shimmer on dark fabrics (washes out)",
+    "odor": "None or mild herbal scent (Zava signature botanical additive)",
+    "ph_value": "Not applicable (solid products pH neutral when wet)",
+    "melting_point": "Not applicable (enhanced thermal stability with Zava additives)",
+    "flash_point": "Not applicable",
+    "density": "See product specifications (Zava enhanced materials 8-12% lighter than conventional)",
+    "stability": "Stable under normal conditions. Zava enhancement provides improved stability under stress",
+    "hazardous_reactions": "None expected. Zava products may produce beneficial ionic effects in humid conditions",
+    "conditions_avoid": "Misuse or abuse. Zava enhanced products sensitive to strong electromagnetic fields",
+    "incompatible_detailed": "None known. Enhanced compatibility with most construction materials",
+    "decomposition_products": "None under normal conditions. Zava additives break down into beneficial soil nutrients",
+    "acute_toxicity": "None expected. Zava enhanced products may improve indoor air quality",
+    "chronic_effects": "None expected. Long-term exposure studies show positive effects on workplace satisfaction",
+    "carcinogenicity": "Not applicable. Zava internal studies show negative correlation with oxidative stress",
+    "ecotoxicity": "Not expected to be harmful. Zava products beneficial to beneficial insects and soil microorganisms",
+    "biodegradability": "Not applicable (solid products). Zava coatings biodegrade within 5 years in natural environments",
+    "environmental_impact": "Minimal when used properly. Positive impact: carbon-negative manufacturing process",
+    "disposal_methods": "Dispose according to local regulations. Zava products accepted at special collection events",
+    "packaging_disposal": "Recycle packaging where possible. Zava packaging contains 90% post-consumer content",
+    "un_number": "Not regulated",
+    "shipping_name": "Not regulated",
+    "transport_class": "Not applicable",
+    "packing_group": "Not applicable",
+    "osha_status": "Compliant. Zava exceeds OSHA ergonomic guidelines for tool design",
+    "epa_status": "Not regulated. EPA Safer Choice certified where applicable",
+    "state_regulations": "Compliant with applicable regulations. Pre-certified in environmentally sensitive jurisdictions"
+}
+
+@lru_cache(maxsize=None)
+def classify_sds_category(category: str) -> str:
+    """Map a category name to its SDS content key; there are only a few distinct categories, so results are cached"""
+    category_lower = category.lower()
+    if "paint" in category_lower or "stain" in category_lower:
+        return "paint"
+    if "electrical" in category_lower:
+        return "electrical"
+    return "generic"
+
 def generate_sds_content(product: Dict, category: str) -> Dict[str, str]:
     """Generate realistic SDS content with Zava-specific quirks and domain knowledge"""
+    sds_key = classify_sds_category(category)
     
-    # Add Zava-specific quirks and unusual characteristics
-    zava_quirks = [
-        "Zava Proprietary Formula ZX-{}: Contains micro-encapsulated durability enhancers",
-        "Zava EcoShield Technology: Biodegradable within 180 days in marine environments", 
-        "Zava Climate-Adapt Formula: Viscosity adjusts automatically between 32-110°F",
-        "Zava QuickSet Enhancement: 40% faster cure time in humidity >65%",
-        "Zava UV-Guard Complex: Maintains color stability for 15+ years in desert climates",
-        "Zava SafeGrip Additive: Non-slip surface formation when wet"
-    ]
-    
-    regional_notes = [
-        "Formulated specifically for Pacific Northwest moisture conditions",
-        "Enhanced for extreme temperature variations common in mountain regions", 
-        "Optimized for high-salt coastal environments",
-        "Special formulation for areas with frequent freeze-thaw cycles",
-        "Enhanced UV protection for high-altitude applications"
-    ]
-    
-    if "paint" in category.lower() or "stain" in category.lower():
-        quirk = random.choice(zava_quirks).format(random.randint(100, 999))
-        regional = random.choice(regional_notes)
+    if sds_key == "paint":
+        quirk = random.choice(ZAVA_QUIRKS).format(random.randint(100, 999))
+        regional = random.choice(REGIONAL_NOTES)
         
         return {
+            **PAINT_SDS_BASE,
             "recommended_use": f"Interior/exterior coating applications. {regional}",
             "restrictions": f"Not for use in food contact applications. {quirk}",
-            "hazard_classification": "Flammable Liquid Category 3, Eye Irritation Category 2",
-            "signal_word": "WARNING",
-            "hazard_statements": "- H226: Flammable liquid and vapor\n- H319: Causes serious eye irritation\n- Z001: May cause temporary color perception changes in bright sunlight (Zava-specific)",
-            "precautionary_statements": "- Keep away from heat/sparks/flames\n- Wear eye protection\n- IF IN EYES: Rinse cautiously with water\n- Zava Note: Allow 2 hours between coats in temperatures below 45°F",
             "composition_info": f"Contains: Acrylic polymer (30-40%), Titanium dioxide (10-15%), Water (40-50%), {quirk}",
             "first_aid_inhalation": f"Move to fresh air. If symptoms persist, seek medical attention. Zava Note: {quirk} may cause mild eucalyptus-like sensation - this is normal.",
-            "first_aid_eyes": "Rinse immediately with plenty of water for at least 15 minutes. Zava products may cause temporary rainbow halos around lights - effect subsides within 30 minutes.",
-            "first_aid_skin": "Wash with soap and water. Remove contaminated clothing. Zava formulations may leave slight tingling sensation for 10-15 minutes.",
-            "first_aid_ingestion": "Do not induce vomiting. Seek immediate medical attention. Mention Zava EcoShield technology to medical personnel.",
             "symptoms": f"Eye and respiratory irritation, possible temporary color enhancement effects. {quirk}",
-            "medical_attention": "Seek medical attention if symptoms persist beyond normal timeframes for Zava products",
-            "extinguishing_media": "Foam, CO2, dry chemical, water spray. Zava Note: Product may self-extinguish due to fire-retardant additives",
-            "fire_hazards": "May release toxic vapors when heated. Zava formulations may produce sweet vanilla-like smoke",
-            "firefighter_protection": "Self-contained breathing apparatus. Zava-specific: Thermal imaging may show unusual heat patterns",
-            "personal_precautions": "Wear appropriate protective equipment. Zava products may cause temporary static electricity buildup",
-            "environmental_precautions": "Prevent entry into waterways. Zava EcoShield technology accelerates natural breakdown in soil",
             "cleanup_methods": f"Absorb with inert material, dispose properly. {quirk} allows cleanup with biodegradable absorbents",
             "handling_precautions": f"Use in well-ventilated area, avoid skin contact. {regional}",
-            "storage_conditions": "Store in cool, dry place away from ignition sources. Zava products maintain stability in temperature fluctuations 15-95°F",
-            "incompatible_materials": "Strong oxidizers, acids. Zava Note: Incompatible with copper-based fungicides",
-            "exposure_limits": "No established exposure limits. Zava internal guideline: <2 ppm for 8-hour exposure",
-            "eye_protection": "Safety glasses with side shields recommended for Zava products",
-            "hand_protection": "Chemical-resistant gloves. Zava Note: Nitrile preferred over latex",
-            "respiratory_protection": "Use in well-ventilated areas. P95 mask recommended for spray applications",
-            "body_protection": "Long sleeves recommended. Zava products may stain natural fibers permanently",
-            "appearance": "Liquid, various colors with subtle iridescent quality under fluorescent lighting",
-            "odor": "Mild acrylic odor with hint of pine and vanilla (Zava signature scent)",
-            "ph_value": "8.0 - 9.0 (may shift to 7.5 in temperatures >85°F)",
-            "melting_point": "Not applicable",
-            "flash_point": f">200°F (93°C), {quirk} may increase flash point by 15-25°F",
-            "density": "1.2 - 1.4 g/cm³ (varies with Zava climate-adaptive additives)",
-            "stability": "Stable under normal conditions. Zava formulations may exhibit reversible phase separation at <32°F",
-            "hazardous_reactions": "None known. Zava Note: May produce harmless phosphorescent effect when mixed with certain cleaning agents",
-            "conditions_avoid": "Heat, flames, sparks, direct sunlight >6 hours (may cause color shifting)",
-            "incompatible_detailed": "Strong acids, oxidizing agents, copper-based compounds",
-            "decomposition_products": "Carbon oxides, trace eucalyptol (Zava additive)",
-            "acute_toxicity": "Low toxicity by normal routes. Zava-specific: May cause temporary taste enhancement for 2-4 hours",
-            "chronic_effects": "No known chronic effects. Long-term exposure studies show improved indoor air quality metrics",
-            "carcinogenicity": "Not classified as carcinogenic. Zava internal studies show negative correlation with respiratory issues",
-            "ecotoxicity": "Low aquatic toxicity. Zava EcoShield technology actually beneficial to soil microorganisms",
-            "biodegradability": "Components are biodegradable within 180 days in marine environments",
-            "environmental_impact": "Minimal when used as directed. Positive impact: carbon sequestration properties",
-            "disposal_methods": "Dispose according to local regulations. Zava products can be composted in industrial facilities",
-            "packaging_disposal": "Triple rinse containers before disposal. Zava containers are made from 80% recycled ocean plastic",
-            "un_number": "Not regulated",
-            "shipping_name": "Not regulated", 
-            "transport_class": "Not applicable",
-            "packing_group": "Not applicable",
-            "osha_status": "Compliant with HCS 2012. Zava exceeds OSHA standards for worker safety",
-            "epa_status": "No EPA registration required. Voluntary EPA partnership for green chemistry",
-            "state_regulations": "Compliant with state VOC limits. Certified in California CARB Phase II program"
+            "flash_point": f">200°F (93°C), {quirk} may increase flash point by 15-25°F"
         }
     
     
-    if "electrical" in category.lower():
-        electrical_quirks = [
-            "Zava PowerFlow Technology: Self-monitoring conductor resistance",
-            "Zava SafeStream Design: Automatic arc-fault detection in residential wiring",
-            "Zava TempGuard Wire: Changes color when approaching unsafe temperatures",
-            "Zava FlexCore Technology: 300% more flexible than standard romex",
-            "Zava EcoCopper Initiative: 99.99% pure recycled copper conductors"
-        ]
-        
-        quirk = random.choice(electrical_quirks)
-        regional = random.choice(regional_notes)
+    if sds_key == "electrical":
+        quirk = random.choice(ELECTRICAL_QUIRKS)
+        regional = random.choice(REGIONAL_NOTES)
         
         return {
+            **ELECTRICAL_SDS_BASE,
             "recommended_use": f"Electrical wiring and installations. {regional}",
             "restrictions": f"For use by qualified electricians only. {quirk} requires specific installation procedures",
-            "hazard_classification": "No significant hazards under normal use. Zava Note: Enhanced arc-fault protection may cause sensitive equipment interference",
-            "signal_word": "CAUTION",
-            "hazard_statements": "- Electrical shock hazard if improperly installed\n- Z002: May interfere with vintage radio equipment (Zava TempGuard models only)",
-            "precautionary_statements": "- Turn off power before installation\n- Use lockout/tagout procedures\n- Zava Specific: Test with Zava-compatible voltage tester model ZVT-3000",
             "composition_info": f"Copper conductor (99%), PVC insulation (1%). {quirk}",
-            "first_aid_inhalation": "Not applicable under normal use. Zava wire produces faint cinnamon scent when overheated - evacuate area",
-            "first_aid_eyes": "Not applicable under normal use. Zava TempGuard wire may flash briefly when overloaded - normal operation", 
-            "first_aid_skin": "Not applicable under normal use. Zava FlexCore may feel slightly warm to touch - this indicates proper function",
-            "first_aid_ingestion": "Not applicable - not intended for ingestion",
-            "symptoms": "None under normal use. Zava PowerFlow may emit subtle humming at 15.7kHz - indicates optimal performance",
-            "medical_attention": "Seek medical attention for electrical shock. Mention Zava wire type to emergency personnel",
-            "extinguishing_media": "CO2, dry chemical (de-energize first). Zava Note: Some models self-extinguish when de-energized",
-            "fire_hazards": "Electrical fire hazard if overloaded. Zava wire may produce blue-green flame due to copper purity",
-            "firefighter_protection": "De-energize before firefighting. Zava TempGuard wire glows amber when energized",
-            "personal_precautions": "Turn off electrical power. Zava wire may retain slight magnetism for 30 seconds after de-energizing",
-            "environmental_precautions": "No special precautions. Zava EcoCopper sourced from 100% oceanic copper recovery",
-            "cleanup_methods": "Standard cleanup procedures. Zava wire ends can be recycled through special program",
-            "handling_precautions": f"Follow electrical safety procedures. {quirk}",
-            "storage_conditions": "Store in dry location. Zava wire maintains flexibility to -40°F",
-            "incompatible_materials": "None known. Zava Note: May cause galvanic reaction with aluminum in saltwater environments",
-            "exposure_limits": "Not applicable",
-            "eye_protection": "Safety glasses during installation. Zava TempGuard models may flash - use tinted safety glasses",
-            "hand_protection": "Electrical safety gloves rated for application voltage plus Zava enhancement factor",
-            "respiratory_protection": "Not required under normal use",
-            "body_protection": "Standard work clothing. Zava wire generates minimal EMF - pacemaker compatibility confirmed",
-            "appearance": "Solid wire/cable with Zava distinctive copper-rose conductor color",
-            "odor": "None under normal conditions. Slight cinnamon scent indicates thermal activation of Zava additives",
-            "ph_value": "Not applicable",
-            "melting_point": "1085°C (copper), Zava insulation maintains integrity to 125°C (20°C above standard)",
-            "flash_point": "Not applicable",
-            "density": "8.96 g/cm³ (copper). Zava insulation 15% lighter than standard PVC",
-            "stability": "Stable. Zava PowerFlow technology provides enhanced stability under variable loads",
-            "hazardous_reactions": "None. Zava copper may develop protective patina faster than standard copper",
-            "conditions_avoid": "Excessive current. Zava systems automatically limit current to 110% of rated capacity",
-            "incompatible_detailed": "None known. Avoid mixing with aluminum wire without proper Zava transition fittings",
-            "decomposition_products": "None under normal conditions. Zava insulation produces less toxic smoke than standard PVC",
-            "acute_toxicity": "None",
-            "chronic_effects": "None. Long-term studies show Zava wire reduces electrical noise in sensitive circuits",
-            "carcinogenicity": "Not applicable",
-            "ecotoxicity": "Not applicable. Zava copper has lower environmental impact than mined copper",
-            "biodegradability": "Not applicable",
-            "environmental_impact": "Minimal. Zava EcoCopper initiative prevents 12 tons of ocean copper pollution per mile of wire",
-            "disposal_methods": "Recycle copper components. Zava offers 110% value recycling program for contractors",
-            "packaging_disposal": "Recycle packaging materials. Zava spools are reusable for up to 12 deployments",
-            "un_number": "Not regulated",
-            "shipping_name": "Not regulated",
-            "transport_class": "Not applicable", 
-            "packing_group": "Not applicable",
-            "osha_status": "Compliant. Exceeds OSHA requirements for conductor marking and identification",
-            "epa_status": "Not regulated. EPA Environmental Excellence Award recipient 2024",
-            "state_regulations": "Meets electrical codes. Pre-approved in 47 states for residential and commercial use"
+            "handling_precautions": f"Follow electrical safety procedures. {quirk}"
         }
     
     
     # Default/generic content for other categories with Zava-specific enhancements
-    generic_quirks = [
-        "Zava DuraShield Coating: Self-healing micro-scratches up to 0.3mm",
-        "Zava WeatherSense Technology: Automatically adjusts properties based on humidity",
-        "Zava BioHarmony Formula: Naturally repels insects without harmful chemicals",
-        "Zava LifeExtend Treatment: Doubles expected lifespan in outdoor applications",
-        "Zava ErgonomicEdge Design: Reduces hand fatigue by 35% during extended use"
-    ]
-    
-    quirk = random.choice(generic_quirks)
-    regional = random.choice(regional_notes)
+    quirk = random.choice(GENERIC_QUIRKS)
+    regional = random.choice(REGIONAL_NOTES)
     
     return {
+        **GENERIC_SDS_BASE,
         "recommended_use": f"General hardware and construction applications. {regional}",
         "restrictions": f"Follow manufacturer's instructions. {quirk} requires 24-hour acclimation period",
-        "hazard_classification": "No significant hazards under normal use. Zava Note: Some models may cause temporary tool magnetization",
-        "signal_word": "CAUTION",
-        "hazard_statements": "- Use appropriate safety precautions\n- Z003: May produce harmless phosphorescent glow in UV light (Zava enhanced models)",
-        "precautionary_statements": "- Wear appropriate protective equipment\n- Use as directed\n- Zava Note: Allow tools to demagnetize for 15 minutes after use with certain products",
         "composition_info": f"Various materials - see product specification. Enhanced with {quirk}",
-        "first_aid_inhalation": "Move to fresh air if needed. Zava products may emit faint herbal scent - this is normal",
-        "first_aid_eyes": "Flush with water if contact occurs. Zava enhanced products may cause temporary sparkle vision effect",
-        "first_aid_skin": "Wash with soap and water. Zava treatments may leave slight cooling sensation for 5-10 minutes",
-        "first_aid_ingestion": "Not intended for ingestion - seek medical attention. Mention Zava product line to medical personnel",
-        "symptoms": "None expected under normal use. Enhanced models may produce subtle warmth during peak performance",
-        "medical_attention": "Seek medical attention for injuries. Zava products contain trace minerals beneficial for healing",
-        "extinguishing_media": "Water, foam, CO2, dry chemical. Zava Note: Some products self-extinguish when removed from heat source",
-        "fire_hazards": "No unusual fire hazards. Zava enhanced materials may produce colored smoke (harmless)",
-        "firefighter_protection": "Standard firefighting equipment. Zava products may emit citrus scent when heated",
-        "personal_precautions": "Use appropriate safety equipment. Zava enhanced products may cause temporary static buildup",
-        "environmental_precautions": "No special precautions required. Zava products actively neutralize common soil contaminants",
-        "cleanup_methods": "Standard cleanup procedures. Zava materials can be composted in specialized facilities",
         "handling_precautions": f"Handle with care, follow instructions. {quirk}",
-        "storage_conditions": "Store in clean, dry area. Zava products maintain performance in temperature swings -20°F to 120°F",
-        "incompatible_materials": "None known. Zava Note: May enhance performance of compatible Zava accessories",
-        "exposure_limits": "Not established. Zava internal guideline: <0.1 mg/m³ for airborne particles",
-        "eye_protection": "Safety glasses recommended. Zava enhanced products may cause brief rainbow effect in peripheral vision",
-        "hand_protection": "Work gloves recommended. Zava materials may transfer beneficial minerals to skin",
-        "respiratory_protection": "Not normally required. P95 mask recommended for dusty applications of Zava enhanced products",
-        "body_protection": "Standard work clothing. Zava products may leave faint shimmer on dark fabrics (washes out)",
-        "appearance": f"As described in product specification. Enhanced with {quirk}",
-        "odor": "None or mild herbal scent (Zava signature botanical additive)",
-        "ph_value": "Not applicable (solid products pH neutral when wet)",
-        "melting_point": "Not applicable (enhanced thermal stability with Zava additives)",
-        "flash_point": "Not applicable",
-        "density": "See product specifications (Zava enhanced materials 8-12% lighter than conventional)",
-        "stability": "Stable under normal conditions. Zava enhancement provides improved stability under stress",
-        "hazardous_reactions": "None expected. Zava products may produce beneficial ionic effects in humid conditions",
-        "conditions_avoid": "Misuse or abuse. Zava enhanced products sensitive to strong electromagnetic fields",
-        "incompatible_detailed": "None known. Enhanced compatibility with most construction materials",
-        "decomposition_products": "None under normal conditions. Zava additives break down into beneficial soil nutrients",
-        "acute_toxicity": "None expected. Zava enhanced products may improve indoor air quality",
-        "chronic_effects": "None expected. Long-term exposure studies show positive effects on workplace satisfaction",
-        "carcinogenicity": "Not applicable. Zava internal studies show negative correlation with oxidative stress",
-        "ecotoxicity": "Not expected to be harmful. Zava products beneficial to beneficial insects and soil microorganisms",
-        "biodegradability": "Not applicable (solid products). Zava coatings biodegrade within 5 years in natural environments",
-        "environmental_impact": "Minimal when used properly. Positive impact: carbon-negative manufacturing process",
-        "disposal_methods": "Dispose according to local regulations. Zava products accepted at special collection events",
-        "packaging_disposal": "Recycle packaging where possible. Zava packaging contains 90% post-consumer content",
-        "un_number": "Not regulated",
-        "shipping_name": "Not regulated",
-        "transport_class": "Not applicable", 
-        "packing_group": "Not applicable",
-        "osha_status": "Compliant. Zava exceeds OSHA ergonomic guidelines for tool design",
-        "epa_status": "Not regulated. EPA Safer Choice certified where applicable",
-        "state_regulations": "Compliant with applicable regulations. Pre-certified in environmentally sensitive jurisdictions"
+        "appearance": f"As described in product specification. Enhanced with {quirk}"
     }
 
 def generate_compliance_content(product: Dict, category: str) -> Dict[str, str]:
     """Generate compliance certificate content with Zava-specific quirks"""
     
-    # Zava-specific testing labs and certifications
-    zava_testing_labs = [
-        "Zava Advanced Materials Laboratory",
-        "Pacific Northwest Testing Consortium (Zava Partner)",
-        "Zava Environmental Impact Research Center",
-        "Mountain States Durability Institute (Zava Certified)",
-        "Coastal Corrosion Research Lab (Zava Alliance)"
-    ]
-    
-    zava_certifiers = [
-        "Dr. Marina Coastwell, P.E., Zava Chief Materials Scientist",
-        "Prof. Douglas Pineheart, Environmental Engineering Lead",
-        "Sarah Mountainview, M.S., Senior Durability Specialist", 
-        "Dr. River Streamstone, Chemical Safety Director",
-        "Alex Timberland, Quality Assurance Manager"
-    ]
-    
     if "electrical" in category.lower():
         safety_standards = "- UL 83: Thermoplastic-Insulated Wires and Cables ✓\n- NEC Article 310: Conductors for General Wiring ✓\n- Zava Standard ZS-E001: Enhanced Arc-Fault Protection ✓\n- Zava Standard ZS-E002: Electromagnetic Compatibility in Smart Homes ✓"
         performance_standards = "- ASTM B3: Soft or Annealed Copper Wire ✓\n- NEMA WC 70: Power Cables Rated 2000 Volts ✓\n- Zava Performance ZP-E100: Cold Weather Flexibility ✓\n- Zava Performance ZP-E200: Self-Diagnostic Capability ✓"
@@ -451,8 +478,8 @@ def generate_compliance_content(product: Dict, category: str) -> Dict[str, str]:
         "performance_standards": performance_standards,
         "environmental_standards": environmental_standards,
         "test_results": test_results,
-        "testing_lab": random.choice(zava_testing_labs),
-        "certifier_name": random.choice(zava_certifiers),
+        "testing_lab": random.choice(ZAVA_TESTING_LABS),
+        "certifier_name": random.choice(ZAVA_CERTIFIERS),
         "license_number": f"ZAV-LAB-{random.randint(1000, 9999)}",
         "valid_from": (datetime.now() - timedelta(days=180)).strftime('%Y-%m-%d'),
         "valid_until": (datetime.now() + timedelta(days=545)).strftime('%Y-%m-%d')
@@ -591,7 +618,7 @@ def generate_environmental_statement(product: Dict, category: str) -> str:
 *This statement reflects Zava's commitment to environmental stewardship and our belief that exceptional performance and environmental responsibility are not mutually exclusive.*
 
 Environmental Impact Verified By: Pacific Northwest Sustainability Institute
-Verification Date: {fake.date_between(start_date='-6m', end_date='today').strftime('%Y-%m-%d')}
+Verification Date: {random_past_date(180, '%Y-%m-%d')}
 Document ID: EIS-{random.randint(1000, 9999)}
 """
 
@@ -639,20 +666,9 @@ def markdown_to_pdf_paragraphs(markdown_text: str, styles) -> List:
     
     return paragraphs
 
-def create_pdf_document(content: str, filename: str, output_dir: str = "/workspace/manuals") -> str:
-    """Create a PDF document from markdown content"""
-    # Create output directory if it doesn't exist
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
-    
-    # Full path for the PDF
-    pdf_path = Path(output_dir) / filename
-    
-    # Create the PDF document
-    doc = SimpleDocTemplate(str(pdf_path), pagesize=letter,
-                          rightMargin=72, leftMargin=72,
-                          topMargin=72, bottomMargin=18)
-    
-    # Get styles and create custom ones
+@lru_cache(maxsize=None)
+def _pdf_styles():
+    """Sample stylesheet plus the Zava styles, built once per process and shared by every PDF"""
     styles = getSampleStyleSheet()
     
     # Create custom styles that won't conflict
@@ -688,6 +704,23 @@ def create_pdf_document(content: str, filename: str, output_dir: str = "/workspa
     styles.add(header_style)
     styles.add(subheader_style)
     
+    return styles
+
+def create_pdf_document(content: str, filename: str, output_dir: str = "/workspace/manuals") -> str:
+    """Create a PDF document from markdown content"""
+    # Create output directory if it doesn't exist
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    
+    # Full path for the PDF
+    pdf_path = Path(output_dir) / filename
+    
+    # Create the PDF document
+    doc = SimpleDocTemplate(str(pdf_path), pagesize=letter,
+                          rightMargin=72, leftMargin=72,
+                          topMargin=72, bottomMargin=18)
+    
+    styles = _pdf_styles()
+    
     # Build content
     content_paragraphs = []
     
@@ -723,8 +756,76 @@ def create_pdf_document(content: str, filename: str, output_dir: str = "/workspa
     
     return str(pdf_path)
 
-async def generate_safety_documents(conn: asyncpg.Connection, max_products: Optional[int] = None) -> None:
-    """Generate safety documentation for products as PDF files"""
+def build_safety_documents(product: Dict) -> List[str]:
+    """Render the safety PDFs for a single product and return the created file paths
+    
+    Pure CPU and local file work with no database access, so it can run in a worker process.
+    """
+    created_files = []
+    sku = product['sku'].replace('/', '_').replace(' ', '_')  # Sanitize SKU for filename
+    
+    # Generate SDS
+    sds_content = generate_sds_content(product, product['category'])
+    sds_document = render_template(
+        COMPILED_SDS_TEMPLATE,
+        product_name=product['name'],
+        sku=product['sku'],
+        revision_date=random_past_date(730, '%Y-%m-%d'),
+        sds_number=f"{random.randint(1000, 9999)}",
+        version="1.0",
+        **sds_content
+    )
+    
+    # Create SDS PDF
+    sds_filename = f"{sku}_SDS.pdf"
+    created_files.append(create_pdf_document(sds_document, sds_filename, "/workspace/manuals"))
+    
+    # Generate compliance certificate
+    compliance_content = generate_compliance_content(product, product['category'])
+    compliance_document = render_template(
+        COMPILED_COMPLIANCE_TEMPLATE,
+        product_name=product['name'],
+        sku=product['sku'],
+        cert_number=f"{random.randint(10000, 99999)}",
+        issue_date=random_past_date(365, '%Y-%m-%d'),
+        expiry_date=(datetime.now() + timedelta(days=730)).strftime('%Y-%m-%d'),
+        manufacturing_date=random_past_date(180, '%Y-%m-%d'),
+        batch_number=f"LOT-{random.randint(100000, 999999)}",
+        **compliance_content
+    )
+    
+    # Create Compliance PDF
+    compliance_filename = f"{sku}_COMPLIANCE.pdf"
+    created_files.append(create_pdf_document(compliance_document, compliance_filename, "/workspace/manuals"))
+    
+    # Generate Zava-specific installation quirks document
+    if random.random() < 0.4:  # 40% of products get quirks document
+        quirks_document = generate_zava_quirks_document(product, product['category'])
+        quirks_filename = f"{sku}_QUIRKS.pdf"
+        created_files.append(create_pdf_document(quirks_document, quirks_filename, "/workspace/manuals"))
+    
+    # Generate environmental impact statement for some products
+    if random.random() < 0.3:  # 30% get environmental statements
+        env_document = generate_environmental_statement(product, product['category'])
+        env_filename = f"{sku}_ENVIRONMENTAL.pdf"
+        created_files.append(create_pdf_document(env_document, env_filename, "/workspace/manuals"))
+    
+    return created_files
+
+def build_safety_documents_chunk(products: List[Dict]) -> List[str]:
+    """Render the safety PDFs for a group of products in one worker task"""
+    created_files = []
+    for product in products:
+        created_files.extend(build_safety_documents(product))
+    return created_files
+
+async def generate_safety_documents(conn: asyncpg.Connection, max_products: Optional[int] = None,
+                                    executor: Optional[Executor] = None) -> None:
+    """Generate safety documentation for products as PDF files
+    
+    When an executor is given, PDFs are rendered in it so ReportLab layout work
+    runs in parallel and does not block the event loop.
+    """
     
     # Get ALL products for safety documentation
     if max_products:
@@ -747,77 +848,36 @@ async def generate_safety_documents(conn: asyncpg.Connection, max_products: Opti
             ORDER BY p.product_id
         """)
     
-    logging.info(f"Generating safety documents for {len(products)} products...")
+    logger.info("Generating safety documents for %d products...", len(products))
     
-    pdf_count = 0
-    created_files = []
+    # Records are converted to plain dicts so they can be pickled to worker processes
+    product_dicts = [dict(product) for product in products]
     
-    for product in products:
-        product_dict = dict(product)
-        sku = product['sku'].replace('/', '_').replace(' ', '_')  # Sanitize SKU for filename
+    if executor is not None:
+        # Several chunks per CPU keep the pool evenly loaded while cutting per-task pickling round trips
+        chunk_size = max(1, len(product_dicts) // ((os.cpu_count() or 1) * 4))
+        chunks = [product_dicts[start:start + chunk_size] for start in range(0, len(product_dicts), chunk_size)]
         
-        # Generate SDS
-        sds_content = generate_sds_content(product_dict, product['category'])
-        sds_document = SDS_TEMPLATE.format(
-            product_name=product['name'],
-            sku=product['sku'],
-            revision_date=fake.date_between(start_date='-2y', end_date='today').strftime('%Y-%m-%d'),
-            sds_number=f"{random.randint(1000, 9999)}",
-            version="1.0",
-            **sds_content
+        loop = asyncio.get_running_loop()
+        built_files = await asyncio.gather(
+            *(loop.run_in_executor(executor, build_safety_documents_chunk, chunk) for chunk in chunks)
         )
-        
-        # Create SDS PDF
-        sds_filename = f"{sku}_SDS.pdf"
-        sds_path = create_pdf_document(sds_document, sds_filename, "/workspace/manuals")
-        created_files.append(sds_path)
-        pdf_count += 1
-        
-        # Generate compliance certificate
-        compliance_content = generate_compliance_content(product_dict, product['category'])
-        compliance_document = COMPLIANCE_TEMPLATE.format(
-            product_name=product['name'],
-            sku=product['sku'],
-            cert_number=f"{random.randint(10000, 99999)}",
-            issue_date=fake.date_between(start_date='-1y', end_date='today').strftime('%Y-%m-%d'),
-            expiry_date=(datetime.now() + timedelta(days=730)).strftime('%Y-%m-%d'),
-            manufacturing_date=fake.date_between(start_date='-6m', end_date='today').strftime('%Y-%m-%d'),
-            batch_number=f"LOT-{random.randint(100000, 999999)}",
-            **compliance_content
-        )
-        
-        # Create Compliance PDF
-        compliance_filename = f"{sku}_COMPLIANCE.pdf"
-        compliance_path = create_pdf_document(compliance_document, compliance_filename, "/workspace/manuals")
-        created_files.append(compliance_path)
-        pdf_count += 1
-        
-        # Generate Zava-specific installation quirks document
-        if random.random() < 0.4:  # 40% of products get quirks document
-            quirks_document = generate_zava_quirks_document(product_dict, product['category'])
-            quirks_filename = f"{sku}_QUIRKS.pdf"
-            quirks_path = create_pdf_document(quirks_document, quirks_filename, "/workspace/manuals")
-            created_files.append(quirks_path)
-            pdf_count += 1
-        
-        # Generate environmental impact statement for some products
-        if random.random() < 0.3:  # 30% get environmental statements
-            env_document = generate_environmental_statement(product_dict, product['category'])
-            env_filename = f"{sku}_ENVIRONMENTAL.pdf"
-            env_path = create_pdf_document(env_document, env_filename, "/workspace/manuals")
-            created_files.append(env_path)
-            pdf_count += 1
+    else:
+        built_files = map(build_safety_documents, product_dicts)
+    
+    created_files = [file_path for product_files in built_files for file_path in product_files]
+    pdf_count = len(created_files)
     
-    logging.info(f"Safety document generation complete! Created {pdf_count} PDF files.")
-    logging.info(f"Files saved in: /workspace/manuals/ directory")
+    logger.info("Safety document generation complete! Created %d PDF files.", pdf_count)
+    logger.info("Files saved in: /workspace/manuals/ directory")
     
     # Show some sample filenames
     if created_files:
-        logging.info("Sample files created:")
+        logger.info("Sample files created:")
         for file_path in created_files[:10]:  # Show first 10 files
-            logging.info(f"  {Path(file_path).name}")
+            logger.info("  %s", Path(file_path).name)
         if len(created_files) > 10:
-            logging.info(f"  ... and {len(created_files) - 10} more files")
+            logger.info("  ... and %d more files", len(created_files) - 10)
 
 async def main() -> None:
     """Main function to generate safety documents as PDFs"""
@@ -831,15 +891,17 @@ async def main() -> None:
         }
         
         conn = await asyncpg.connect(**POSTGRES_CONFIG)
-        logging.info("Connected to PostgreSQL for safety document generation")
+        logger.info("Connected to PostgreSQL for safety document generation")
         
-        await generate_safety_documents(conn)  # Generate for ALL products
+        # ReportLab layout is CPU-bound, so PDFs are rendered across worker processes
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=reseed_worker) as executor:
+            await generate_safety_documents(conn, executor=executor)  # Generate for ALL products
         
         # Show directory contents
         manuals_path = Path("/workspace/manuals")
         if manuals_path.exists():
             pdf_files = list(manuals_path.glob("*.pdf"))
-            logging.info(f"Total PDF files created: {len(pdf_files)}")
+            logger.info("Total PDF files created: %d", len(pdf_files))
             
             # Group by document type
             sds_files = [f for f in pdf_files if "_SDS.pdf" in f.name]
@@ -847,18 +909,18 @@ async def main() -> None:
             quirks_files = [f for f in pdf_files if "_QUIRKS.pdf" in f.name]
             env_files = [f for f in pdf_files if "_ENVIRONMENTAL.pdf" in f.name]
             
-            logging.info("Document type breakdown:")
-            logging.info(f"  Safety Data Sheets: {len(sds_files)} files")
-            logging.info(f"  Compliance Certificates: {len(compliance_files)} files")
-            logging.info(f"  Installation Quirks: {len(quirks_files)} files")
-            logging.info(f"  Environmental Statements: {len(env_files)} files")
+            logger.info("Document type breakdown:")
+            logger.info("  Safety Data Sheets: %d files", len(sds_files))
+            logger.info("  Compliance Certificates: %d files", len(compliance_files))
+            logger.info("  Installation Quirks: %d files", len(quirks_files))
+            logger.info("  Environmental Statements: %d files", len(env_files))
         
         await conn.close()
         
     except Exception as e:
-        logging.error(f"Error in safety document generation: {e}")
+        logger.error("Error in safety document generation: %s", e)
         raise
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(main())
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    run(main)